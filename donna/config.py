@@ -45,9 +45,12 @@ USER_NAME: str = os.getenv("USER_NAME", "User")
 
 # ─── STT ─────────────────────────────────────────────────────────────────────
 WHISPER_MODEL_SIZE: str = os.getenv("WHISPER_MODEL_SIZE", "small")
-# "cpu" or "cuda"
-WHISPER_DEVICE: str = os.getenv("WHISPER_DEVICE", "cpu")
-WHISPER_COMPUTE_TYPE: str = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+# "auto", "cpu" or "cuda"; auto uses CUDA when CTranslate2 can see a GPU
+WHISPER_DEVICE: str = os.getenv("WHISPER_DEVICE", "auto")
+# Empty = pick per device: int8_float16 on CUDA, int8 on CPU
+WHISPER_COMPUTE_TYPE: str = os.getenv("WHISPER_COMPUTE_TYPE", "")
+# 1 = greedy decoding; raise for beam search at several times the decode cost
+WHISPER_BEAM_SIZE: int = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
 
 # ─── TTS ─────────────────────────────────────────────────────────────────────
 TTS_VOICE: str = os.getenv("TTS_VOICE", "bf_emma")
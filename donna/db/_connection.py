@@ -0,0 +1,124 @@
+"""
+db/_connection.py — Persistent per-thread SQLite connections shared by the DB modules.
+
+Opening a connection is far more expensive than the tiny queries Donna runs,
+so each thread keeps one long-lived handle per database file and reuses it.
+"""
+
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+# Per-connection settings, applied in one batch when a connection is opened.
+# journal_mode=WAL is persistent in the database file, so init_db() sets it
+# once rather than every connection re-issuing it.
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA wal_autocheckpoint=1000;
+PRAGMA busy_timeout=5000;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+"""
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        path, detect_types=sqlite3.PARSE_DECLTYPES, cached_statements=256
+    )
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_CONNECTION_PRAGMAS)
+    logger.debug(
+        "Opened SQLite connection to %s on thread %s.",
+        path, threading.current_thread().name,
+    )
+    return conn
+
+
+def _thread_conn(path: str) -> sqlite3.Connection:
+    conns: dict[str, sqlite3.Connection] | None = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        conn = conns[path] = _connect(path)
+    return conn
+
+
+@contextmanager
+def get_connection(path: str) -> Iterator[sqlite3.Connection]:
+    """
+    Yield this thread's connection to `path`, committing on success and
+    rolling back on error.  The connection stays open for the next call.
+    """
+    conn = _thread_conn(path)
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """A cursor yielding plain tuples, for hot reads that unpack columns directly."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
+def enable_wal(conn: sqlite3.Connection) -> None:
+    """Switch the database file to write-ahead logging (persists across opens)."""
+    conn.execute("PRAGMA journal_mode=WAL;")
+
+
+def checkpoint(path: str) -> None:
+    """Fold the WAL back into the main database without blocking writers."""
+    with get_connection(path) as conn:
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE);")
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version;").fetchone()[0]
+
+
+def set_schema_version(conn: sqlite3.Connection, version: int) -> None:
+    # PRAGMA arguments can't be bound as parameters.
+    conn.execute(f"PRAGMA user_version = {int(version)};")
+
+
+def table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = ? LIMIT 1", (name,)
+    ).fetchone()
+    return row is not None
+
+
+def fts_phrase(text: str) -> str | None:
+    """
+    Quote `text` as a single FTS5 phrase for a trigram-tokenised table.
+
+    Returns None when the text is shorter than one trigram; such queries
+    can't use the index and callers fall back to LIKE.
+    """
+    text = text.strip()
+    if len(text) < 3:
+        return None
+    return '"' + text.replace('"', '""') + '"'
+
+
+def close_thread_connections() -> None:
+    """Close every connection held by the calling thread."""
+    conns = getattr(_local, "conns", None) or {}
+    for conn in conns.values():
+        try:
+            conn.close()
+        except Exception:
+            pass
+    conns.clear()
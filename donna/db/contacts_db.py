@@ -5,16 +5,25 @@ Schema, initialisation, and low-level CRUD helpers used by contacts_tools.py.
 The `notes` column is append-only: every update prefixes a timestamped entry.
 """
 
-import sqlite3
 import logging
-from datetime import datetime
-from contextlib import contextmanager
 from typing import Optional
 
 from donna.config import CONTACTS_DB_PATH
+from donna.db._connection import (
+    get_connection,
+    enable_wal,
+    schema_version,
+    set_schema_version,
+    table_exists,
+    fts_phrase,
+    checkpoint as _checkpoint,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever _DDL / _FTS_DDL change so init_db() re-runs them on existing files.
+_SCHEMA_VERSION = 2
+
 _DDL = """
 CREATE TABLE IF NOT EXISTS contacts (
     id         INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -28,33 +37,74 @@ CREATE TABLE IF NOT EXISTS contacts (
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
+-- full_name is NOT NULL, so this index is already NULL-free; it stays a full
+-- index so list_contacts can walk it in NOCASE order without a sort.
 CREATE INDEX IF NOT EXISTS idx_contacts_full_name ON contacts(full_name COLLATE NOCASE);
-CREATE INDEX IF NOT EXISTS idx_contacts_email     ON contacts(email COLLATE NOCASE);
+
+-- email/company are often NULL; partial indexes skip those rows and still
+-- serve `= ?` and LIKE-prefix lookups, which imply IS NOT NULL.
+DROP INDEX IF EXISTS idx_contacts_email;
+DROP INDEX IF EXISTS idx_contacts_company;
+CREATE INDEX IF NOT EXISTS idx_contacts_email_nn   ON contacts(email COLLATE NOCASE)   WHERE email IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_contacts_company_nn ON contacts(company COLLATE NOCASE) WHERE company IS NOT NULL;
 """
 
+# Trigram full-text index over the searchable columns, kept in sync by triggers.
+# Trigram tokens preserve substring semantics, so it replaces `LIKE '%q%'` scans.
+_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5(
+    full_name, email, company,
+    content='contacts', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts(rowid, full_name, email, company)
+    VALUES (new.id, new.full_name, new.email, new.company);
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts(contacts_fts, rowid, full_name, email, company)
+    VALUES ('delete', old.id, old.full_name, old.email, old.company);
+END;
+
+CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE OF full_name, email, company ON contacts BEGIN
+    INSERT INTO contacts_fts(contacts_fts, rowid, full_name, email, company)
+    VALUES ('delete', old.id, old.full_name, old.email, old.company);
+    INSERT INTO contacts_fts(rowid, full_name, email, company)
+    VALUES (new.id, new.full_name, new.email, new.company);
+END;
+"""
+
+# SQL prefix for a notes entry: "[YYYY-MM-DD HH:MM:SS] " in local time, computed
+# by SQLite so no Python datetime is built per write.
+_NOTE_STAMP = "'[' || datetime('now', 'localtime') || '] '"
+
 
-@contextmanager
 def _get_conn():
-    conn = sqlite3.connect(CONTACTS_DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL;")
-    try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+    return get_connection(CONTACTS_DB_PATH)
 
 
 def init_db() -> None:
     """Create tables if they don't exist."""
     with _get_conn() as conn:
+        if schema_version(conn) == _SCHEMA_VERSION:
+            logger.debug("Contacts DB schema v%d already present.", _SCHEMA_VERSION)
+            return
+        enable_wal(conn)
         conn.executescript(_DDL)
+        fts_is_new = not table_exists(conn, "contacts_fts")
+        conn.executescript(_FTS_DDL)
+        if fts_is_new:
+            conn.execute("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')")
+        set_schema_version(conn, _SCHEMA_VERSION)
     logger.info("Contacts DB initialised at %s", CONTACTS_DB_PATH)
 
 
+def checkpoint() -> None:
+    """Passive WAL checkpoint; called periodically by the scheduler."""
+    _checkpoint(CONTACTS_DB_PATH)
+
+
 def add_contact(
     full_name: str,
     company: Optional[str] = None,
@@ -64,15 +114,14 @@ def add_contact(
     notes: Optional[str] = None,
 ) -> int:
     """Insert a new contact and return its id."""
-    ts = datetime.now().isoformat(sep=" ", timespec="seconds")
-    stamped_notes = f"[{ts}] {notes}" if notes else None
     with _get_conn() as conn:
         cur = conn.execute(
-            """
+            f"""
             INSERT INTO contacts (full_name, company, title, email, phone, notes)
-            VALUES (?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, {_NOTE_STAMP} || ?)
             """,
-            (full_name, company, title, email, phone, stamped_notes),
+            # NULL notes stay NULL: concatenating with NULL yields NULL.
+            (full_name, company, title, email, phone, notes or None),
         )
         return cur.lastrowid
 
@@ -85,6 +134,19 @@ def get_contact_by_id(contact_id: int) -> Optional[dict]:
         return dict(row) if row else None
 
 
+def get_contacts_by_ids(ids: list[int]) -> list[dict]:
+    """Fetch several contacts in one query, returned in the order of `ids`."""
+    if not ids:
+        return []
+    with _get_conn() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM contacts WHERE id IN ({','.join('?' * len(ids))})",
+            tuple(ids),
+        ).fetchall()
+    by_id = {row["id"]: dict(row) for row in rows}
+    return [by_id[i] for i in ids if i in by_id]
+
+
 def list_contacts(limit: int = 50, offset: int = 0) -> list[dict]:
     with _get_conn() as conn:
         rows = conn.execute(
@@ -94,22 +156,111 @@ def list_contacts(limit: int = 50, offset: int = 0) -> list[dict]:
         return [dict(r) for r in rows]
 
 
+# `_` is deliberately excluded: it is common in email addresses.
+_WILDCARDS = frozenset("%*")
+
+
+# Most rows search_contacts_exact returns
+_SEARCH_LIMIT = 20
+
+
 def search_contacts_exact(query: str) -> list[dict]:
-    """Case-insensitive substring search on name, email, company."""
-    pat = f"%{query}%"
+    """
+    Case-insensitive search on name, email, company.
+
+    A query without wildcards first tries whole-value equality, which is an
+    index seek.  Exact matches come first; substring matches then fill the
+    rest of the results, so "John" still finds "John Smith" alongside a
+    contact named exactly "John".  The substring stage is skipped only when
+    exact matches already fill the limit.
+    """
+    has_wildcards = not _WILDCARDS.isdisjoint(query)
     with _get_conn() as conn:
+        exact = []
+        if not has_wildcards:
+            exact = conn.execute(
+                """
+                SELECT * FROM contacts
+                WHERE  id IN (
+                    SELECT id FROM contacts WHERE full_name = ? COLLATE NOCASE
+                    UNION
+                    SELECT id FROM contacts WHERE email     = ? COLLATE NOCASE
+                    UNION
+                    SELECT id FROM contacts WHERE company   = ? COLLATE NOCASE
+                )
+                ORDER BY full_name COLLATE NOCASE
+                LIMIT ?
+                """,
+                (query, query, query, _SEARCH_LIMIT),
+            ).fetchall()
+            if len(exact) >= _SEARCH_LIMIT:
+                return [dict(r) for r in exact]
+
+        # Exact hits also match as substrings, so over-fetch by that many
+        # and drop them below.
+        rows = _substring_matches(conn, query, has_wildcards, _SEARCH_LIMIT + len(exact))
+
+    seen = {r["id"] for r in exact}
+    results = [dict(r) for r in exact]
+    for r in rows:
+        if len(results) >= _SEARCH_LIMIT:
+            break
+        if r["id"] not in seen:
+            seen.add(r["id"])
+            results.append(dict(r))
+    return results
+
+
+def _substring_matches(conn, query: str, has_wildcards: bool, limit: int) -> list:
+    phrase = None if has_wildcards else fts_phrase(query)
+    if phrase is not None:
         rows = conn.execute(
             """
-            SELECT * FROM contacts
-            WHERE  full_name LIKE ? COLLATE NOCASE
-               OR  email     LIKE ? COLLATE NOCASE
-               OR  company   LIKE ? COLLATE NOCASE
-            ORDER BY full_name COLLATE NOCASE
-            LIMIT 20
+            SELECT c.* FROM contacts_fts
+            JOIN   contacts c ON c.id = contacts_fts.rowid
+            WHERE  contacts_fts MATCH ?
+            ORDER BY c.full_name COLLATE NOCASE
+            LIMIT ?
             """,
-            (pat, pat, pat),
+            (phrase, limit),
         ).fetchall()
-        return [dict(r) for r in rows]
+        if rows:
+            return rows
+        # No contiguous match: look for any of the words instead, best
+        # BM25 rank first, so "John from Microsoft" still finds John.
+        words = [fts_phrase(w) for w in query.split()]
+        words = [w for w in words if w is not None]
+        if len(words) < 2:
+            return []
+        return conn.execute(
+            """
+            SELECT c.* FROM contacts_fts
+            JOIN   contacts c ON c.id = contacts_fts.rowid
+            WHERE  contacts_fts MATCH ?
+            ORDER BY bm25(contacts_fts)
+            LIMIT 5
+            """,
+            (" OR ".join(words),),
+        ).fetchall()
+
+    pat = f"%{query.replace('*', '%')}%"
+    return conn.execute(
+        """
+        SELECT * FROM contacts
+        WHERE  full_name LIKE ? COLLATE NOCASE
+           OR  email     LIKE ? COLLATE NOCASE
+           OR  company   LIKE ? COLLATE NOCASE
+        ORDER BY full_name COLLATE NOCASE
+        LIMIT ?
+        """,
+        (pat, pat, pat, limit),
+    ).fetchall()
+
+
+# Scalar columns update_contact may set, in declared order.  The SET clause is
+# always built in this order so each field combination maps to exactly one SQL
+# string, keeping the connection's statement cache hot.
+_UPDATABLE_COLUMNS = ("full_name", "company", "title", "email", "phone")
 
 
 def update_contact(contact_id: int, fields: dict) -> bool:
@@ -120,35 +271,32 @@ def update_contact(contact_id: int, fields: dict) -> bool:
     if not fields:
         return False
 
-    # Handle notes append separately
+    # Notes are appended rather than assigned
     note_text = fields.pop("notes", None)
 
-    ts = datetime.now().isoformat(sep=" ", timespec="seconds")
-
-    with _get_conn() as conn:
-        if note_text:
-            row = conn.execute(
-                "SELECT notes FROM contacts WHERE id = ?", (contact_id,)
-            ).fetchone()
-            existing = row["notes"] if row and row["notes"] else ""
-            sep = "\n" if existing else ""
-            new_notes = f"{existing}{sep}[{ts}] {note_text}"
-            conn.execute(
-                "UPDATE contacts SET notes = ?, updated_at = ? WHERE id = ?",
-                (new_notes, ts, contact_id),
-            )
-
-        if fields:
-            set_clause = ", ".join(f"{k} = ?" for k in fields)
-            values = list(fields.values()) + [ts, contact_id]
-            cur = conn.execute(
-                f"UPDATE contacts SET {set_clause}, updated_at = ? WHERE id = ?",
-                values,
-            )
-            return cur.rowcount > 0
+    unknown = fields.keys() - set(_UPDATABLE_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown contact field(s): {', '.join(sorted(unknown))}")
+    columns = [c for c in _UPDATABLE_COLUMNS if c in fields]
 
+    set_parts = [f"{c} = ?" for c in columns]
+    values = [fields[c] for c in columns]
+    if note_text:
+        # Append in SQL so the existing notes never round-trip through Python.
+        set_parts.append(
+            f"notes = COALESCE(NULLIF(notes, '') || char(10), '') || {_NOTE_STAMP} || ?"
+        )
+        values.append(note_text)
+    if not set_parts:
         return True
 
+    with _get_conn() as conn:
+        cur = conn.execute(
+            f"UPDATE contacts SET {', '.join(set_parts)}, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            values + [contact_id],
+        )
+        return cur.rowcount > 0
+
 
 def delete_contact(contact_id: int) -> bool:
     with _get_conn() as conn:
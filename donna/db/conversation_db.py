@@ -5,12 +5,15 @@ Stores every LLM turn (user / assistant / tool) with its session_id.
 Provides token-aware loading so we never exceed the context budget.
 """
 
-import sqlite3
+import functools
+import hashlib
 import logging
+import queue
+import threading
+import time
 import uuid
 from datetime import datetime, date
-from contextlib import contextmanager
-from typing import Optional
+from typing import Iterable, Optional
 
 from donna.config import (
     CONVERSATION_DB_PATH,
@@ -18,9 +21,22 @@ from donna.config import (
     LLM_MAX_HISTORY_MESSAGES,
     LLM_MAX_HISTORY_TOKENS,
 )
+from donna.db._connection import (
+    get_connection,
+    enable_wal,
+    schema_version,
+    set_schema_version,
+    table_exists,
+    tuple_cursor,
+    fts_phrase,
+    checkpoint as _checkpoint,
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever _DDL / _FTS_DDL change so init_db() re-runs them on existing files.
+_SCHEMA_VERSION = 2
+
 _DDL = """
 CREATE TABLE IF NOT EXISTS conversations (
     id         INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -32,113 +48,266 @@ CREATE TABLE IF NOT EXISTS conversations (
 
 CREATE INDEX IF NOT EXISTS idx_conv_session ON conversations(session_id);
 CREATE INDEX IF NOT EXISTS idx_conv_ts      ON conversations(timestamp);
+CREATE INDEX IF NOT EXISTS idx_conv_session_role ON conversations(session_id, role);
+-- Dialogue rows only: load_history walks this newest-first and skips events.
+CREATE INDEX IF NOT EXISTS idx_conv_dialogue ON conversations(id)
+    WHERE role IN ('user', 'assistant');
+
+-- Proactive messages delivered per day, keyed by what they were about
+-- (e.g. 'meeting_prep:<event id>') rather than by their wording.
+CREATE TABLE IF NOT EXISTS proactive_deliveries (
+    day        TEXT NOT NULL,
+    dedupe_key TEXT NOT NULL,
+    PRIMARY KEY (day, dedupe_key)
+) WITHOUT ROWID;
 """
 
-# Module-level session_id — assigned once on import.
-_SESSION_ID: str = ""
+# Trigram full-text index over message content, kept in sync by triggers.
+# Trigram tokens preserve substring semantics, so it replaces `LIKE '%q%'` scans.
+_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS conversations_fts USING fts5(
+    content,
+    content='conversations', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS conversations_fts_ai AFTER INSERT ON conversations BEGIN
+    INSERT INTO conversations_fts(rowid, content) VALUES (new.id, new.content);
+END;
 
+CREATE TRIGGER IF NOT EXISTS conversations_fts_ad AFTER DELETE ON conversations BEGIN
+    INSERT INTO conversations_fts(conversations_fts, rowid, content)
+    VALUES ('delete', old.id, old.content);
+END;
 
-def _make_session_id() -> str:
-    if SESSION_MODE == "daily":
-        return str(date.today())
+CREATE TRIGGER IF NOT EXISTS conversations_fts_au AFTER UPDATE OF content ON conversations BEGIN
+    INSERT INTO conversations_fts(conversations_fts, rowid, content)
+    VALUES ('delete', old.id, old.content);
+    INSERT INTO conversations_fts(rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+
+@functools.cache
+def _process_session_id() -> str:
     return str(uuid.uuid4())
 
 
 def get_session_id() -> str:
-    global _SESSION_ID
-    if not _SESSION_ID:
-        _SESSION_ID = _make_session_id()
-    return _SESSION_ID
+    """
+    Current session_id: today's date in "daily" mode, so a long-running
+    process rolls over at midnight; otherwise one id per process.
+    """
+    if SESSION_MODE == "daily":
+        return _today_date_str()
+    return _process_session_id()
 
 
-def _today_date_str() -> str:
+@functools.lru_cache(maxsize=1)
+def _date_str_for_minute(_minute: int) -> str:
     return date.today().isoformat()
 
 
-@contextmanager
+def _today_date_str() -> str:
+    # Recomputed at most once per minute; the argument is only the cache key.
+    return _date_str_for_minute(int(time.time() // 60))
+
+
 def _get_conn():
-    conn = sqlite3.connect(
-        CONVERSATION_DB_PATH, detect_types=sqlite3.PARSE_DECLTYPES
-    )
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL;")
-    try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+    return get_connection(CONVERSATION_DB_PATH)
+
+
+def _read_conn():
+    """Connection for reads: waits for queued writes first (read-your-writes)."""
+    flush()
+    return _get_conn()
 
 
 def init_db() -> None:
     with _get_conn() as conn:
+        if schema_version(conn) == _SCHEMA_VERSION:
+            logger.debug("Conversation DB schema v%d already present.", _SCHEMA_VERSION)
+            return
+        enable_wal(conn)
         conn.executescript(_DDL)
+        fts_is_new = not table_exists(conn, "conversations_fts")
+        conn.executescript(_FTS_DDL)
+        if fts_is_new:
+            conn.execute("INSERT INTO conversations_fts(conversations_fts) VALUES ('rebuild')")
+        set_schema_version(conn, _SCHEMA_VERSION)
     logger.info("Conversation DB initialised at %s", CONVERSATION_DB_PATH)
 
 
+def checkpoint() -> None:
+    """Passive WAL checkpoint; called periodically by the scheduler."""
+    _checkpoint(CONVERSATION_DB_PATH)
+
+
 def record_app_event(event: str) -> None:
     """Record a lightweight app lifecycle event (e.g. 'opened' / 'closed')."""
-    with _get_conn() as conn:
-        conn.execute(
-            "INSERT INTO conversations (role, content, session_id) VALUES (?, ?, ?)",
-            ("event", event, get_session_id()),
-        )
+    _enqueue_writes([("event", event)])
+
+
+def _today_filter() -> tuple[str, tuple]:
+    """
+    WHERE fragment + params selecting today's rows.
+
+    In "daily" mode the session_id *is* today's date, so an equality match on
+    the (session_id, role) index replaces the timestamp range scan.
+    """
+    today = _today_date_str()
+    if SESSION_MODE == "daily":
+        return "session_id = ?", (today,)
+    return "timestamp BETWEEN ? AND ?", (f"{today} 00:00:00", f"{today} 23:59:59")
 
 
 def get_app_events_today() -> list[dict]:
     """Return all recorded app events for today (role='event')."""
-    today = _today_date_str()
-    start = f"{today} 00:00:00"
-    end = f"{today} 23:59:59"
-    with _get_conn() as conn:
+    where, params = _today_filter()
+    with _read_conn() as conn:
         rows = conn.execute(
-            "SELECT role, content, timestamp FROM conversations WHERE role = ? AND timestamp BETWEEN ? AND ? ORDER BY id",
-            ("event", start, end),
+            f"SELECT role, content, timestamp FROM conversations WHERE {where} AND role = ? ORDER BY id",
+            (*params, "event"),
         ).fetchall()
     return [dict(r) for r in rows]
 
 
 def get_assistant_messages_today() -> list[dict]:
     """Return assistant (`role = 'assistant'`) messages from today, chronological."""
-    today = _today_date_str()
-    start = f"{today} 00:00:00"
-    end = f"{today} 23:59:59"
-    with _get_conn() as conn:
+    where, params = _today_filter()
+    with _read_conn() as conn:
         # Assistant messages are stored with role='assistant'.
         rows = conn.execute(
-            "SELECT role, content, timestamp FROM conversations WHERE role = ? AND timestamp BETWEEN ? AND ? ORDER BY id",
-            ("assistant", start, end),
+            f"SELECT role, content, timestamp FROM conversations WHERE {where} AND role = ? ORDER BY id",
+            (*params, "assistant"),
         ).fetchall()
     return [dict(r) for r in rows]
 
 
+# In-memory digests of today's assistant messages, loaded from the DB on first
+# use, kept current by save_messages() and discarded when the date rolls over.
+_spoken_today: set[bytes] | None = None
+_spoken_today_date: str = ""
+_spoken_lock = threading.Lock()
+
+
+def _content_digest(content: str) -> bytes:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def _spoken_today_digests() -> set[bytes]:
+    """Return today's digest set, (re)loading it if needed.  Hold _spoken_lock."""
+    global _spoken_today, _spoken_today_date
+    today = _today_date_str()
+    if _spoken_today is None or _spoken_today_date != today:
+        _spoken_today = {
+            _content_digest(m["content"]) for m in get_assistant_messages_today()
+        }
+        _spoken_today_date = today
+    return _spoken_today
+
+
 def has_assistant_message_today(content: str) -> bool:
     """Return True if the exact content was already spoken by Donna today."""
-    today = _today_date_str()
-    start = f"{today} 00:00:00"
-    end = f"{today} 23:59:59"
+    with _spoken_lock:
+        return _content_digest(content) in _spoken_today_digests()
+
+
+def has_assistant_dedupe_key_today(key: str) -> bool:
+    """Return True if a proactive message with this dedupe key was delivered today."""
     with _get_conn() as conn:
         row = conn.execute(
-            "SELECT 1 FROM conversations WHERE role = ? AND content = ? AND timestamp BETWEEN ? AND ? LIMIT 1",
-            ("assistant", content, start, end),
+            "SELECT 1 FROM proactive_deliveries WHERE day = ? AND dedupe_key = ?",
+            (_today_date_str(), key),
         ).fetchone()
-    return bool(row)
+    return row is not None
 
 
-def save_message(role: str, content: str) -> None:
-    """Persist a single turn to the database."""
+def record_assistant_dedupe_key(key: str) -> None:
+    """Mark the proactive message identified by `key` as delivered today."""
     with _get_conn() as conn:
         conn.execute(
+            "INSERT OR IGNORE INTO proactive_deliveries (day, dedupe_key) VALUES (?, ?)",
+            (_today_date_str(), key),
+        )
+
+
+def save_message(role: str, content: str) -> None:
+    """Queue a single turn for the background writer; returns immediately."""
+    _enqueue_writes([(role, content)])
+
+
+def save_messages(rows: Iterable[tuple[str, str]]) -> None:
+    """
+    Queue several (role, content) turns as one batch; they are committed
+    together, in order with anything queued before them.  Returns immediately.
+    """
+    _enqueue_writes(list(rows))
+
+
+def _insert_rows(rows: list[tuple[str, str]]) -> None:
+    sid = get_session_id()
+    with _get_conn() as conn:
+        conn.executemany(
             "INSERT INTO conversations (role, content, session_id) VALUES (?, ?, ?)",
-            (role, content, get_session_id()),
+            [(role, content, sid) for role, content in rows],
         )
 
 
-def _rough_token_count(text: str) -> int:
-    """~4 chars per token — good enough for budget management."""
-    return max(1, len(text) // 4)
+def _note_spoken(rows: list[tuple[str, str]]) -> None:
+    spoken = [content for role, content in rows if role == "assistant"]
+    if spoken:
+        with _spoken_lock:
+            if _spoken_today is not None and _spoken_today_date == _today_date_str():
+                _spoken_today.update(_content_digest(c) for c in spoken)
+
+
+# ─── Background writer ────────────────────────────────────────────────────────
+# save_message(s)()/record_app_event() only enqueue; one daemon thread drains
+# the queue and commits whatever has accumulated in a single transaction, so
+# the voice/UI path never waits on SQLite.  Reads call flush() first so callers
+# always see their own writes.  Each queue item is one caller's batch of rows.
+
+_write_q: "queue.Queue[list[tuple[str, str]]]" = queue.Queue()
+_writer_thread: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+def _writer_loop() -> None:
+    while True:
+        batches = [_write_q.get()]
+        while True:
+            try:
+                batches.append(_write_q.get_nowait())
+            except queue.Empty:
+                break
+        rows = [row for batch in batches for row in batch]
+        try:
+            _insert_rows(rows)
+        except Exception:
+            logger.exception("Failed to write %d conversation row(s).", len(rows))
+        finally:
+            for _ in batches:
+                _write_q.task_done()
+
+
+def _enqueue_writes(rows: list[tuple[str, str]]) -> None:
+    global _writer_thread
+    if _writer_thread is None:
+        with _writer_lock:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(
+                    target=_writer_loop, daemon=True, name="ConversationWriter"
+                )
+                _writer_thread.start()
+    if not rows:
+        return
+    _note_spoken(rows)
+    _write_q.put_nowait(rows)
+
+
+def flush() -> None:
+    """Block until every queued write has been committed."""
+    _write_q.join()
 
 
 def load_history(
@@ -149,51 +318,109 @@ def load_history(
     Return conversation history as a list of {"role": ..., "content": ...} dicts
     suitable for passing directly to the Claude API.
 
-    Messages are loaded newest-first, then reversed so the list is chronological.
-    Token budget is applied before reversing.
+    The newest `max_messages` turns are considered and the token budget is
+    applied newest-first (~4 chars per token), all inside SQLite: a running
+    window sum drops everything past the budget, so no over-budget text is
+    ever handed back to Python.  Rows come back in chronological order.
     """
+    with _read_conn() as conn:
+        rows = _newest_history_rows(conn, max_messages, max_tokens)
+    return [{"role": role, "content": content} for _id, role, content in rows]
+
+
+def _newest_history_rows(conn, max_messages: int, max_tokens: int) -> list[tuple]:
     # Exclude non-dialogue events so LLM history contains only 'user' and 'assistant'
-    with _get_conn() as conn:
-        rows = conn.execute(
-            """
-            SELECT role, content FROM conversations
-            WHERE role IN ('user', 'assistant')
-            ORDER BY id DESC
-            LIMIT ?
-            """,
-            (max_messages,),
-        ).fetchall()
+    return tuple_cursor(conn).execute(
+        """
+        SELECT id, role, content FROM (
+            SELECT id, role, content,
+                   SUM(MAX(1, length(content) / 4)) OVER (ORDER BY id DESC) AS cum_tokens
+            FROM (
+                SELECT id, role, content FROM conversations
+                WHERE role IN ('user', 'assistant')
+                ORDER BY id DESC
+                LIMIT ?
+            )
+        )
+        WHERE cum_tokens <= ?
+        ORDER BY id
+        """,
+        (max_messages, max_tokens),
+    ).fetchall()
 
-    # Apply token budget (newest messages win)
-    kept: list[dict] = []
-    total_tokens = 0
-    for row in rows:
-        tokens = _rough_token_count(row["content"])
-        if total_tokens + tokens > max_tokens:
-            break
-        kept.append({"role": row["role"], "content": row["content"]})
-        total_tokens += tokens
 
-    kept.reverse()  # chronological order
-    return kept
+def load_history_window(
+    floor_id: int = 0,
+    max_messages: int = LLM_MAX_HISTORY_MESSAGES,
+    max_tokens: int = LLM_MAX_HISTORY_TOKENS,
+) -> tuple[int, list[dict]]:
+    """
+    Like load_history(), but keeps the oldest turn fixed between calls so the
+    start of the history sent to Claude stays byte-identical and its prompt
+    cache keeps hitting.
+
+    Every turn from `floor_id` onwards is returned while that still fits the
+    limits.  Once it doesn't (or on the first call, floor_id=0) the window
+    is re-anchored on the newest turns fitting half the limits, leaving room
+    to grow before the next re-anchor.  Returns (floor_id, history); pass the
+    floor back in on the next call.
+    """
+    with _read_conn() as conn:
+        if floor_id:
+            count, tokens = conn.execute(
+                """
+                SELECT COUNT(*), TOTAL(MAX(1, length(content) / 4)) FROM conversations
+                WHERE role IN ('user', 'assistant') AND id >= ?
+                """,
+                (floor_id,),
+            ).fetchone()
+            if count <= max_messages and tokens <= max_tokens:
+                rows = tuple_cursor(conn).execute(
+                    """
+                    SELECT id, role, content FROM conversations
+                    WHERE role IN ('user', 'assistant') AND id >= ?
+                    ORDER BY id
+                    """,
+                    (floor_id,),
+                ).fetchall()
+                return floor_id, [{"role": r, "content": c} for _id, r, c in rows]
+
+        rows = _newest_history_rows(conn, max(1, max_messages // 2), max_tokens // 2)
+    floor_id = rows[0][0] if rows else 0
+    return floor_id, [{"role": r, "content": c} for _id, r, c in rows]
 
 
 def load_session_history(session_id: Optional[str] = None) -> list[dict]:
     """Load all messages for a specific session (default: current)."""
     sid = session_id or get_session_id()
     # Only return conversational roles for session history
-    with _get_conn() as conn:
-        rows = conn.execute(
+    with _read_conn() as conn:
+        cur = tuple_cursor(conn).execute(
             "SELECT role, content FROM conversations WHERE session_id = ? AND role IN ('user', 'assistant') ORDER BY id",
             (sid,),
-        ).fetchall()
-    return [{"role": r["role"], "content": r["content"]} for r in rows]
+        )
+        return [{"role": role, "content": content} for role, content in cur]
 
 
 def search_history(keyword: str, limit: int = 10) -> list[dict]:
     """Full-text keyword search across all stored messages."""
-    pat = f"%{keyword}%"
-    with _get_conn() as conn:
+    phrase = fts_phrase(keyword)
+    with _read_conn() as conn:
+        if phrase is not None:
+            rows = conn.execute(
+                """
+                SELECT c.role, c.content, c.timestamp, c.session_id
+                FROM conversations_fts
+                JOIN conversations c ON c.id = conversations_fts.rowid
+                WHERE conversations_fts MATCH ?
+                ORDER BY c.id DESC
+                LIMIT ?
+                """,
+                (phrase, limit),
+            ).fetchall()
+            return [dict(r) for r in rows]
+
+        pat = f"%{keyword}%"
         rows = conn.execute(
             """
             SELECT role, content, timestamp, session_id
@@ -207,13 +434,71 @@ def search_history(keyword: str, limit: int = 10) -> list[dict]:
     return [dict(r) for r in rows]
 
 
+def search_history_any(
+    keywords: Iterable[str],
+    limit: int = 10,
+    exclude_session: Optional[str] = None,
+) -> list[dict]:
+    """
+    Newest messages containing any of `keywords`, in a single query.
+
+    Messages from `exclude_session` are filtered out in SQL.
+    """
+    keywords = [k for k in keywords if k]
+    if not keywords:
+        return []
+    phrases = [fts_phrase(k) for k in keywords]
+    exclude = exclude_session or ""
+    with _read_conn() as conn:
+        if None not in phrases:
+            rows = conn.execute(
+                """
+                SELECT c.role, c.content, c.timestamp, c.session_id
+                FROM conversations_fts
+                JOIN conversations c ON c.id = conversations_fts.rowid
+                WHERE conversations_fts MATCH ? AND c.session_id != ?
+                ORDER BY c.id DESC
+                LIMIT ?
+                """,
+                (" OR ".join(phrases), exclude, limit),
+            ).fetchall()
+            return [dict(r) for r in rows]
+
+        like = " OR ".join(["content LIKE ?"] * len(keywords))
+        rows = conn.execute(
+            f"""
+            SELECT role, content, timestamp, session_id
+            FROM conversations
+            WHERE ({like}) AND session_id != ?
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (*(f"%{k}%" for k in keywords), exclude, limit),
+        ).fetchall()
+    return [dict(r) for r in rows]
+
+
 def get_recent_sessions(n: int = 7) -> list[str]:
-    """Return the n most recent distinct session_ids."""
-    with _get_conn() as conn:
+    """
+    Return the n most recently active distinct session_ids.
+
+    A recursive "loose index scan" hops between distinct values of
+    idx_conv_session (one seek per session rather than one step per message),
+    then ranks each session by its newest row via another index seek.
+    """
+    with _read_conn() as conn:
         rows = conn.execute(
             """
-            SELECT DISTINCT session_id FROM conversations
-            ORDER BY id DESC
+            WITH RECURSIVE sessions(sid) AS (
+                SELECT MIN(session_id) FROM conversations
+                UNION ALL
+                SELECT (SELECT MIN(session_id) FROM conversations WHERE session_id > sid)
+                FROM sessions
+                WHERE sid IS NOT NULL
+            )
+            SELECT sid AS session_id FROM sessions
+            WHERE sid IS NOT NULL
+            ORDER BY (SELECT MAX(id) FROM conversations WHERE session_id = sid) DESC
             LIMIT ?
             """,
             (n,),
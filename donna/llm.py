@@ -10,22 +10,30 @@ Responsibilities:
 - Expose a single synchronous `chat(user_message)` → str interface
 """
 
+import importlib
+import importlib.util
 import json
 import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Callable
 
-import anthropic
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from donna.config import ANTHROPIC_API_KEY, CLAUDE_MODEL, USER_NAME
 from donna.db import conversation_db
-from donna.tools import gmail_tools, calendar_tools, contacts_tools, web_tools
 
 logger = logging.getLogger(__name__)
 
 # ─── System prompt ────────────────────────────────────────────────────────────
 
-_SYSTEM_PROMPT_TEMPLATE = """You are Donna, a highly capable British personal assistant. You are professional, warm, efficient, and proactive. You communicate in natural, conversational British English — not overly formal, not casual.
+_SYSTEM_PROMPT = """You are Donna, a highly capable British personal assistant. You are professional, warm, efficient, and proactive. You communicate in natural, conversational British English — not overly formal, not casual.
 
 Your responsibilities:
 - Manage and summarise emails and calendar events on behalf of the user
@@ -59,22 +67,45 @@ Tool use:
 - For open source projects, libraries, and technical documentation: use the search or fetch tools to find authoritative sources
 - Use tools silently — do not narrate tool calls to the user
 - Synthesise tool results into natural language responses
-- When fetching URLs, extract and summarise relevant content naturally
+- When fetching URLs, extract and summarise relevant content naturally"""
 
-Current date and time: {datetime}
+# Per-request context, sent after the cached prompt so it can change every
+# minute without invalidating the cached tools + instructions prefix.
+_SYSTEM_CONTEXT_TEMPLATE = """Current date and time: {datetime}
 User's name: {user_name}"""
 
 
-def _build_system_prompt() -> str:
-    return _SYSTEM_PROMPT_TEMPLATE.format(
-        datetime=datetime.now().strftime("%A, %d %B %Y, %H:%M"),
-        user_name=USER_NAME,
-    )
+# (minute-resolution timestamp, system blocks) — the context only changes
+# when the minute does, so loop iterations within a minute reuse one value.
+_prompt_cache: tuple[str, list[dict]] | None = None
+
+
+def _build_system_prompt() -> list[dict]:
+    """
+    Return the system prompt as two text blocks: the static instructions,
+    flagged for Anthropic prompt caching so they (and the tool schema ahead
+    of them) are read from cache across minutes and chats, then the uncached
+    date/time and user-name context.
+    """
+    global _prompt_cache
+    stamp = datetime.now().strftime("%A, %d %B %Y, %H:%M")
+    cached = _prompt_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    context = _SYSTEM_CONTEXT_TEMPLATE.format(datetime=stamp, user_name=USER_NAME)
+    blocks = [
+        {"type": "text", "text": _SYSTEM_PROMPT, "cache_control": _EPHEMERAL},
+        {"type": "text", "text": context},
+    ]
+    _prompt_cache = (stamp, blocks)
+    return blocks
 
 
 # ─── Tool definitions (Claude tool-use schema) ───────────────────────────────
 
-TOOL_DEFINITIONS: list[dict] = [
+# Built once at import and shared by every request; a tuple so nothing can
+# append to it between calls.
+TOOL_DEFINITIONS: tuple[dict, ...] = (
     # ── Gmail ──
     {
         "name": "get_emails",
@@ -152,6 +183,39 @@ TOOL_DEFINITIONS: list[dict] = [
             "required": ["start_date", "end_date"],
         },
     },
+    {
+        "name": "get_calendar_events_multi",
+        "description": "Fetch calendar events for several date ranges at once, e.g. to compare days. Prefer this over repeated get_calendar_events calls.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "ranges": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "start_date": {
+                                "type": "string",
+                                "description": "Start date/datetime in ISO format.",
+                            },
+                            "end_date": {
+                                "type": "string",
+                                "description": "End date/datetime in ISO format.",
+                            },
+                        },
+                        "required": ["start_date", "end_date"],
+                    },
+                    "description": "Date ranges to fetch.",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum events per range (default 20).",
+                    "default": 20,
+                },
+            },
+            "required": ["ranges"],
+        },
+    },
     {
         "name": "create_calendar_event",
         "description": "Create a new calendar event. Always confirm with the user before calling.",
@@ -284,6 +348,26 @@ TOOL_DEFINITIONS: list[dict] = [
             "required": ["url"],
         },
     },
+    {
+        "name": "fetch_urls",
+        "description": "Fetch and summarise several web pages at once. Prefer this over repeated fetch_url calls.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Full URLs to fetch.",
+                },
+                "max_length": {
+                    "type": "integer",
+                    "description": "Maximum character length of content per page (default 2000).",
+                    "default": 2000,
+                },
+            },
+            "required": ["urls"],
+        },
+    },
     {
         "name": "search_opensource",
         "description": "Search for open source projects, libraries, documentation, and resources on GitHub, PyPI, npm, etc.",
@@ -303,30 +387,73 @@ TOOL_DEFINITIONS: list[dict] = [
             "required": ["query"],
         },
     },
-]
+)
 
 # ─── Tool dispatch ────────────────────────────────────────────────────────────
 
-_TOOL_MAP: dict[str, Callable[..., Any]] = {
-    "get_emails":             gmail_tools.get_emails,
-    "send_email":             gmail_tools.send_email,
-    "get_thread":             gmail_tools.get_thread,
-    "get_calendar_events":    calendar_tools.get_calendar_events,
-    "create_calendar_event":  calendar_tools.create_calendar_event,
-    "update_calendar_event":  calendar_tools.update_calendar_event,
-    "delete_calendar_event":  calendar_tools.delete_calendar_event,
-    "lookup_contact":         contacts_tools.lookup_contact,
-    "add_contact":            contacts_tools.add_contact,
-    "update_contact":         contacts_tools.update_contact,
-    "search_contacts":        contacts_tools.search_contacts,
-    "web_search":             web_tools.web_search,
-    "fetch_url":              web_tools.fetch_url,
-    "search_opensource":      web_tools.search_opensource,
+# Tool name → module under donna.tools.  The modules pull in the Google API
+# client stack, so they are imported on the first tool call rather than at
+# startup; functions share the tool's name.
+_TOOL_MODULES: dict[str, str] = {
+    "get_emails":             "gmail_tools",
+    "send_email":             "gmail_tools",
+    "get_thread":             "gmail_tools",
+    "get_calendar_events":    "calendar_tools",
+    "get_calendar_events_multi": "calendar_tools",
+    "create_calendar_event":  "calendar_tools",
+    "update_calendar_event":  "calendar_tools",
+    "delete_calendar_event":  "calendar_tools",
+    "lookup_contact":         "contacts_tools",
+    "add_contact":            "contacts_tools",
+    "update_contact":         "contacts_tools",
+    "search_contacts":        "contacts_tools",
+    "web_search":             "web_tools",
+    "fetch_url":              "web_tools",
+    "fetch_urls":             "web_tools",
+    "search_opensource":      "web_tools",
 }
 
+_TOOL_MAP: dict[str, Callable[..., Any]] | None = None
+_tool_map_lock = threading.Lock()
+
+
+def _get_tool_map() -> dict[str, Callable[..., Any]]:
+    global _TOOL_MAP
+    if _TOOL_MAP is None:
+        with _tool_map_lock:
+            if _TOOL_MAP is None:
+                _TOOL_MAP = {
+                    name: getattr(importlib.import_module(f"donna.tools.{module}"), name)
+                    for name, module in _TOOL_MODULES.items()
+                }
+    return _TOOL_MAP
+
+
+def _dumps(obj: Any) -> str:
+    """Serialise a tool payload to JSON text, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+class _JsonPreview:
+    """Defers JSON-encoding a log argument until the record is emitted."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return _dumps(self.obj)[:200]
+
+
+# Tool functions are blocking network/SQLite I/O, so threads overlap them well.
+_tool_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ToolCall")
+
 
 def _dispatch_tool(name: str, tool_input: dict) -> Any:
-    fn = _TOOL_MAP.get(name)
+    fn = _get_tool_map().get(name)
     if fn is None:
         return {"error": f"Unknown tool: {name}"}
     try:
@@ -336,12 +463,77 @@ def _dispatch_tool(name: str, tool_input: dict) -> Any:
         return {"error": str(exc)}
 
 
+# ─── Prompt caching ───────────────────────────────────────────────────────────
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+# Id of the oldest stored turn sent to Claude.  Held between chats so the
+# history prefix only shifts when load_history_window() re-anchors it.
+_history_floor = 0
+
+
+def _mark_cache_breakpoint(messages: list[dict]) -> None:
+    """
+    Flag the last message as an Anthropic prompt-cache breakpoint.
+
+    Called once before the agentic loop, so every tool-use iteration resends
+    the same history prefix and reads it from cache instead of reprocessing it.
+    """
+    if not messages:
+        return
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    else:
+        content = [dict(block) for block in content]
+    content[-1]["cache_control"] = _EPHEMERAL
+    messages[-1] = {"role": last["role"], "content": content}
+
+
 # ─── Main chat function ───────────────────────────────────────────────────────
 
-_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+_client = None
+
+
+def _get_client():
+    """Create the Anthropic client on first use; the SDK is slow to import."""
+    global _client
+    if _client is None:
+        import anthropic
+        import httpx
+
+        # Keep connections alive across the seconds spent running tools so
+        # each agentic-loop iteration skips the TCP/TLS handshake.  HTTP/2
+        # needs the optional `h2` package; without it httpx stays on 1.1.
+        http_client = anthropic.DefaultHttpxClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_keepalive_connections=4,
+                max_connections=8,
+                keepalive_expiry=60.0,
+            ),
+        )
+        # Responses are streamed; the read timeout bounds the gap between
+        # chunks so a stalled connection fails fast instead of hanging.
+        _client = anthropic.Anthropic(
+            api_key=ANTHROPIC_API_KEY,
+            timeout=anthropic.Timeout(60.0, read=30.0, connect=10.0),
+            http_client=http_client,
+        )
+    return _client
+
 
+# Enough for legitimate multi-step chains (brief, look up, check calendar, send).
+_MAX_TOOL_ITERATIONS = 12
 
-def chat(user_message: str, on_tool_call: Callable[[str, dict], None] | None = None) -> str:
+
+def chat(
+    user_message: str,
+    on_tool_call: Callable[[str, dict], None] | None = None,
+    on_token: Callable[[str], None] | None = None,
+    on_turn_end: Callable[[bool], None] | None = None,
+) -> str:
     """
     Send a user message to Claude, handle any tool calls, and return the
     final text response.
@@ -350,36 +542,44 @@ def chat(user_message: str, on_tool_call: Callable[[str, dict], None] | None = N
         user_message:  The text typed or transcribed from the user.
         on_tool_call:  Optional callback invoked with (tool_name, tool_input)
                        each time Claude calls a tool — useful for UI status updates.
+        on_token:      Optional callback invoked with each text fragment as it
+                       streams in, before the full response is available.
+                       Fragments from every loop iteration are passed,
+                       including any text in tool-use turns.
+        on_turn_end:   Optional callback invoked after each loop iteration
+                       with True for the final turn and False for a tool-use
+                       turn, so streamed text can be kept or discarded.
 
     Returns:
         Claude's final text response as a string.
     """
-    # Persist user turn
-    conversation_db.save_message("user", user_message)
-
-    # Build message history
-    history = conversation_db.load_history()
-    # Ensure the message we just saved appears (load_history may lag behind
-    # in edge cases, so we append explicitly if not already present).
-    if not history or history[-1]["content"] != user_message:
-        history.append({"role": "user", "content": user_message})
-
-    messages = history.copy()
-
-    # Agentic loop: keep calling until no more tool_use blocks
-    while True:
-        response = _client.messages.create(
+    # Build message history from the turns before this one, then add the new
+    # user turn in memory.  The history returned is a fresh list, so the loop
+    # below extends it in place.
+    global _history_floor
+    _history_floor, messages = conversation_db.load_history_window(_history_floor)
+    messages.append({"role": "user", "content": user_message})
+
+    _mark_cache_breakpoint(messages)
+
+    # Agentic loop: keep calling until no more tool_use blocks, up to a cap
+    # so a model or schema bug can't spin forever
+    for _iteration in range(_MAX_TOOL_ITERATIONS):
+        with _get_client().messages.stream(
             model=CLAUDE_MODEL,
             max_tokens=4096,
             system=_build_system_prompt(),
             tools=TOOL_DEFINITIONS,
             messages=messages,
-            timeout=60.0,
-        )
+        ) as stream:
+            if on_token:
+                for text in stream.text_stream:
+                    on_token(text)
+            response = stream.get_final_message()
 
-        # Collect text from this response turn
+        # Split this turn's blocks into text and tool calls in one pass
         text_parts: list[str] = []
-        tool_uses: list[dict] = []
+        tool_uses: list[Any] = []
 
         for block in response.content:
             if block.type == "text":
@@ -390,31 +590,147 @@ def chat(user_message: str, on_tool_call: Callable[[str, dict], None] | None = N
         # Add Claude's response to the message chain
         messages.append({"role": "assistant", "content": response.content})
 
-        if response.stop_reason != "tool_use" or not tool_uses:
-            # Final response — no more tool calls
-            final_text = " ".join(text_parts).strip()
-            conversation_db.save_message("assistant", final_text)
+        is_final = response.stop_reason != "tool_use" or not tool_uses
+        if on_turn_end:
+            on_turn_end(is_final)
+
+        if is_final:
+            # Final response — no more tool calls.  Text blocks carry their
+            # own spacing, so they are joined as-is.
+            final_text = "".join(text_parts).strip()
+            # Persist the whole turn as one queued batch (one commit)
+            conversation_db.save_messages(
+                [("user", user_message), ("assistant", final_text)]
+            )
             return final_text
 
-        # Process tool calls and build tool_result message
-        tool_results = []
+        # Process tool calls and build tool_result message.  Independent
+        # calls in the same turn run concurrently; results keep block order.
+        pending = []
         for tool_use_block in tool_uses:
             tool_name = tool_use_block.name
             tool_input = tool_use_block.input
-            logger.info("Tool call: %s(%s)", tool_name, json.dumps(tool_input)[:200])
+            logger.info("Tool call: %s(%s)", tool_name, _JsonPreview(tool_input))
 
             if on_tool_call:
                 on_tool_call(tool_name, tool_input)
 
-            result = _dispatch_tool(tool_name, tool_input)
+            if len(tool_uses) == 1:
+                result = _dispatch_tool(tool_name, tool_input)
+            else:
+                result = _tool_pool.submit(_dispatch_tool, tool_name, tool_input)
+            pending.append((tool_use_block.id, result))
+
+        tool_results = []
+        for tool_use_id, result in pending:
+            if isinstance(result, Future):
+                result = result.result()
             tool_results.append({
                 "type": "tool_result",
-                "tool_use_id": tool_use_block.id,
-                "content": json.dumps(result, default=str),
+                "tool_use_id": tool_use_id,
+                "content": _dumps(result),
             })
 
         messages.append({"role": "user", "content": tool_results})
 
+    raise RuntimeError(
+        f"Claude was still calling tools after {_MAX_TOOL_ITERATIONS} iterations"
+    )
+
+
+# Whitespace following sentence-ending punctuation; streamed text is cut here.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def chat_stream(
+    user_message: str,
+    on_tool_call: Callable[[str, dict], None] | None = None,
+    on_sentence: Callable[[str], None] | None = None,
+) -> str:
+    """
+    Like chat(), but also hands each complete sentence to `on_sentence` as
+    soon as it has streamed in, so speech can start before Claude finishes.
+
+    Any trailing text without closing punctuation is emitted once the
+    response is complete.  Text still buffered when a tool-use turn ends is
+    dropped rather than carried into the next turn, so narration ahead of a
+    tool call isn't spoken or glued onto the answer.  Returns the full final
+    text, as chat() does.
+    """
+    if on_sentence is None:
+        return chat(user_message, on_tool_call=on_tool_call)
+
+    buffer = ""
+
+    def _on_token(fragment: str) -> None:
+        nonlocal buffer
+        buffer += fragment
+        last = None
+        for last in _SENTENCE_BREAK.finditer(buffer):
+            pass
+        if last is not None:
+            on_sentence(buffer[:last.start()])
+            buffer = buffer[last.end():]
+
+    def _on_turn_end(final: bool) -> None:
+        nonlocal buffer
+        if not final:
+            if buffer.strip():
+                logger.debug("Dropping narration before tool call: %r", buffer)
+            buffer = ""
+
+    reply = chat(
+        user_message,
+        on_tool_call=on_tool_call,
+        on_token=_on_token,
+        on_turn_end=_on_turn_end,
+    )
+    if buffer.strip():
+        on_sentence(buffer)
+    return reply
+
+
+# ─── Proactive response cache ─────────────────────────────────────────────────
+#
+# Scheduler prompts repeat verbatim (the hourly follow-up reminder, a meeting
+# alert re-queued after a restart).  Reusing the earlier reply skips the API
+# call, and because the text is identical the proactive handler's "already
+# said today" check suppresses it rather than Donna paraphrasing the same
+# reminder every hour.
+
+_RESPONSE_TTL_SECONDS: dict[str, float] = {
+    "meeting_prep": 60 * 60,
+    "followups": 24 * 60 * 60,
+}
+
+# (scope, prompt) → (expiry as time.monotonic(), response)
+_response_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_response_cache_lock = threading.Lock()
+
+
+def cached_chat(prompt: str, scope: str) -> str:
+    """
+    chat() for scheduler prompts, reusing a response to the identical prompt
+    within the scope's TTL.  Empty responses are not cached.
+    """
+    key = (scope, prompt)
+    now = time.monotonic()
+    with _response_cache_lock:
+        hit = _response_cache.get(key)
+        if hit is not None and hit[0] > now:
+            logger.info("Reusing cached %s response.", scope)
+            return hit[1]
+
+    response = chat(prompt)
+    if response:
+        ttl = _RESPONSE_TTL_SECONDS.get(scope, 60 * 60)
+        with _response_cache_lock:
+            # Drop expired entries so the cache can't grow without bound
+            for k in [k for k, (exp, _r) in _response_cache.items() if exp <= now]:
+                del _response_cache[k]
+            _response_cache[key] = (time.monotonic() + ttl, response)
+    return response
+
 
 def morning_brief() -> str:
     """
@@ -2,24 +2,30 @@
 main.py — Donna application entry point.
 
 Lifecycle:
-  1. Initialise databases
+  1. Open the floating UI window (main thread — Tkinter requirement)
   2. Start system tray
-  3. Launch ProactiveScheduler
-  4. Start WakeWordEngine (background thread)
-  5. Open the floating UI window (main thread — Tkinter requirement)
+  3. In a background thread, while the window is already visible:
+     initialise databases, launch ProactiveScheduler, start WakeWordEngine
+  4. Run the Tk main loop
 
-The voice interaction loop runs in a dedicated thread:
-  WakeWord detected → STT → LLM → TTS → back to WakeWord
+The voice interaction loop is split across two threads:
+  WakeWord thread:    WakeWord detected → STT → queue the transcript
+  Interaction thread: queued turn → LLM → TTS (+ follow-ups)
 
-Text input from the UI bypasses wake word and STT,
-going directly: text → LLM → TTS.
+Text input from the UI bypasses wake word and STT and is queued
+directly: text → LLM → TTS.  Turns are answered in arrival order.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
 import threading
 import time
 import os
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # ─── Data directory must exist before logging tries to open the log file ──────
@@ -35,35 +41,48 @@ if str(_REPO_ROOT) not in sys.path:
 
 # ─── Logging setup ────────────────────────────────────────────────────────────
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(
-            _DATA_DIR / "donna.log",
-            encoding="utf-8",
-        ),
-    ],
-)
+# Callers only enqueue records; a background listener formats them and does
+# the console/file writes, so logging never blocks the voice pipeline.
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+_log_handlers: list[logging.Handler] = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler(
+        _DATA_DIR / "donna.log",
+        encoding="utf-8",
+    ),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+# QueueHandler.prepare() bakes its formatted text into record.msg, so it must
+# only render the message (and any traceback); the listener's handlers add
+# the timestamp/level/name prefix.
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.getLogger().addHandler(_queue_handler)
+logging.getLogger().setLevel(logging.INFO)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("donna.main")
 
 
-def _ensure_data_dir() -> None:
-    _DATA_DIR.mkdir(exist_ok=True)
-
-
-_ensure_data_dir()
-
 # ─── Application imports (after logging is set) ───────────────────────────────
 
-from donna.config import PICOVOICE_ACCESS_KEY, WAKE_WORD_MODEL_PATH, CHIME_PATH
+from donna.config import (
+    PICOVOICE_ACCESS_KEY,
+    WAKE_WORD_MODEL_PATH,
+    CHIME_PATH,
+    STT_INITIAL_TIMEOUT,
+    VAD_FRAME_DURATION_MS,
+)
 from donna.db import contacts_db, conversation_db
+from donna.db._connection import close_thread_connections
 from donna.ui.window import DonnaWindow
 from donna.ui.tray import SystemTray
 from donna import tts, stt
 from donna.scheduler import ProactiveScheduler
-from donna import llm
 
 # ─── Global state ─────────────────────────────────────────────────────────────
 
@@ -72,54 +91,78 @@ _wake_engine = None
 _scheduler: ProactiveScheduler | None = None
 _muted = False
 _voice_stop_flag = threading.Event()
-_interaction_lock = threading.Lock()  # prevent overlapping interactions
+_interaction_lock = threading.Lock()  # held while a turn is answered (LLM → TTS → follow-ups)
+_capture_lock = threading.Lock()      # held while a wake-word utterance is captured
+_turn_q: "queue.SimpleQueue[str]" = queue.SimpleQueue()  # user turns awaiting an answer
+_ready = threading.Event()  # set once background start-up has finished
+
+# Trailing silence (~5 s) that ends the user's turn, in VAD frames
+_POST_SPEECH_SILENCE_FRAMES = int(5000 / VAD_FRAME_DURATION_MS)
 
 
 # ─── Audio helpers ────────────────────────────────────────────────────────────
 
-def _play_chime() -> None:
+@functools.cache
+def _load_chime():
+    """Decode the chime once; returns (samples, samplerate) or None."""
     try:
         import soundfile as sf
-        import sounddevice as sd
         import numpy as np
         if Path(CHIME_PATH).exists():
-            data, sr = sf.read(CHIME_PATH)
-            sd.play(np.array(data, dtype=np.float32), samplerate=sr, blocking=False)
+            data, sr = sf.read(CHIME_PATH, dtype="float32", always_2d=False)
+            return np.ascontiguousarray(data), sr
     except Exception:
-        pass  # chime is nice-to-have; never block on it
+        logger.debug("Chime could not be loaded.", exc_info=True)
+    return None
+
+
+def _play_chime() -> None:
+    chime = _load_chime()
+    if chime is not None:
+        try:
+            import sounddevice as sd
+            data, sr = chime
+            sd.play(data, samplerate=sr, blocking=False)
+            return
+        except Exception:
+            pass  # chime is nice-to-have; never block on it
 
     # Fallback: if WAV wasn't available or playback failed, play a simple
     # system beep so the user hears the cue.  Use winsound on Windows; on
     # other platforms try the ASCII bell as a fallback.
     try:
-        if not Path(CHIME_PATH).exists():
-            if os.name == "nt":
-                import winsound
+        if os.name == "nt":
+            import winsound
 
+            try:
+                winsound.MessageBeep(-1)
+            except Exception:
                 try:
-                    winsound.MessageBeep(-1)
-                except Exception:
-                    try:
-                        winsound.Beep(800, 150)
-                    except Exception:
-                        pass
-            else:
-                # Best-effort fallback: ASCII bell
-                try:
-                    print("\a", end="", flush=True)
+                    winsound.Beep(800, 150)
                 except Exception:
                     pass
+        else:
+            # Best-effort fallback: ASCII bell
+            try:
+                print("\a", end="", flush=True)
+            except Exception:
+                pass
     except Exception:
         pass
 
 
 # ─── Interaction pipeline ─────────────────────────────────────────────────────
 
-def _on_proactive_response(text: str) -> None:
+def _on_proactive_response(text: str, dedupe_key: str | None = None) -> None:
     """Called by the scheduler when a proactive message is generated."""
-    # Avoid repeating the same proactive message if Donna already said it today
+    # Avoid repeating the same proactive message if Donna already said it
+    # today; keyed messages are matched by key since their wording varies.
     try:
-        if conversation_db.has_assistant_message_today(text):
+        if dedupe_key is not None:
+            already_said = conversation_db.has_assistant_dedupe_key_today(dedupe_key)
+        else:
+            already_said = conversation_db.has_assistant_message_today(text)
+        if already_said:
             logger.info("Proactive message suppressed (already said today).")
             return
     except Exception:
@@ -130,66 +173,71 @@ def _on_proactive_response(text: str) -> None:
     tts.speak(text, block=False)
     try:
         conversation_db.save_message("assistant", text)
+        if dedupe_key is not None:
+            conversation_db.record_assistant_dedupe_key(dedupe_key)
     except Exception:
         logger.exception("Failed to save proactive message to conversation DB.")
 
 
+def _on_tool(name: str, _input: dict) -> None:
+    logger.debug("Tool: %s", name)
+
+
+def _queue_tts_sentence(sentence: str) -> None:
+    if _window:
+        _window.set_state("speaking")
+    tts.speak(sentence, block=False, enqueue=True)
+
+
 def _handle_llm_response(user_text: str) -> None:
     """Run LLM + TTS for a given user message.  Always called from a thread."""
+    # Imported here so the Anthropic SDK and tool modules load after the
+    # window is up rather than delaying startup.
+    from donna import llm
+
     if _window:
-        _window.set_thinking(True)
+        _window.set_state("thinking")
     try:
-        def _on_tool(name: str, _input: dict) -> None:
-            logger.debug("Tool: %s", name)
-
         # Handle the initial user message and up to a few quick follow-ups
         # listened for immediately after Donna finishes speaking. This keeps
         # the whole interaction inside the same `_interaction_lock`.
         cur_user_text = user_text
         followups_remaining = 3
         while True:
-            response = llm.chat(cur_user_text, on_tool_call=_on_tool)
+            # Sentences are queued for speech as they stream in, so Donna
+            # starts talking while the rest of the reply is still generating.
+            response = llm.chat_stream(
+                cur_user_text,
+                on_tool_call=_on_tool,
+                on_sentence=_queue_tts_sentence,
+            )
             # Always speak user-triggered responses (no suppression).
             # Only proactive messages are suppressed if already said today.
-            if _window:
-                _window.add_message("Donna", response)
-                _window.set_speaking(True)
-            tts.speak(response, block=True)
-            try:
-                conversation_db.save_message("assistant", response)
-            except Exception:
-                logger.exception("Failed to save Donna response to DB.")
+            # An empty reply (e.g. a tool-only turn) has nothing to show or say.
+            if response:
+                if _window:
+                    _window.add_message("Donna", response)
+                    _window.set_state("speaking")
+                tts.wait()
 
             # After Donna speaks, wait up to 5s for the user to start talking.
             # If the user starts within that window, record until there are
             # 5 seconds of silence after the user finishes speaking.
             if _window:
-                _window.set_listening(True)
-            try:
-                from donna.config import VAD_FRAME_DURATION_MS
-
-                post_silence_ms = 5000
-                post_silence_frames = int(post_silence_ms / VAD_FRAME_DURATION_MS)
-
-                wav = stt.record_until_silence(
-                    timeout_seconds=5.0,
-                    stop_flag=_voice_stop_flag,
-                    silence_frames_override=post_silence_frames,
-                )
-            finally:
-                if _window:
-                    _window.set_listening(False)
-
-            if not wav:
-                break
+                _window.set_state("listening")
+            follow = stt.record_and_transcribe(
+                timeout_seconds=5.0,
+                stop_flag=_voice_stop_flag,
+                silence_frames_override=_POST_SPEECH_SILENCE_FRAMES,
+            )
 
-            follow = stt.transcribe(wav)
             if not follow:
                 break
 
             logger.info("User (follow-up) said: %r", follow)
             if _window:
                 _window.add_message("You", follow)
+                _window.set_state("thinking")
             cur_user_text = follow
             followups_remaining -= 1
             if followups_remaining <= 0:
@@ -200,16 +248,14 @@ def _handle_llm_response(user_text: str) -> None:
             _window.add_message("Donna", "Sorry, something went wrong. Please try again.")
     finally:
         if _window:
-            _window.set_thinking(False)
-            _window.set_speaking(False)
-            _window.set_listening(False)
+            _window.set_state("idle")
 
 
 def _on_wake() -> None:
     """Called by WakeWordEngine (from its background thread) on detection."""
     if _muted:
         return
-    if not _interaction_lock.acquire(blocking=False):
+    if _interaction_lock.locked() or not _capture_lock.acquire(blocking=False):
         logger.debug("Wake word ignored — interaction already in progress.")
         return
     try:
@@ -217,28 +263,23 @@ def _on_wake() -> None:
         tts.interrupt()
 
         if _window:
-            _window.set_listening(True)
+            _window.set_state("listening")
 
         # Chime playback disabled to avoid the cue being captured by the mic
         # and transcribed. Transcript will be captured directly from the
         # wake-word engine's stream.
         transcript = ""
-        from donna.config import STT_INITIAL_TIMEOUT, VAD_FRAME_DURATION_MS
-
         if _wake_engine:
             try:
                 # Wait up to STT_INITIAL_TIMEOUT, and treat N frames (~5s) of
                 # trailing silence as end-of-speech so users aren't cut off.
-                post_silence_ms = 5000
-                post_silence_frames = int(post_silence_ms / VAD_FRAME_DURATION_MS)
-
-                wav = _wake_engine.capture_audio_for_stt(
+                audio = _wake_engine.capture_audio_for_stt(
                     timeout_seconds=STT_INITIAL_TIMEOUT,
                     stop_flag=_voice_stop_flag,
-                    silence_frames_override=post_silence_frames,
+                    silence_frames_override=_POST_SPEECH_SILENCE_FRAMES,
                 )
-                if wav:
-                    transcript = stt.transcribe(wav)
+                if audio is not None:
+                    transcript = stt.transcribe(audio)
                 else:
                     transcript = ""
             except Exception:
@@ -252,30 +293,38 @@ def _on_wake() -> None:
         if not transcript:
             logger.info("No speech detected after wake word.")
             if _window:
-                _window.set_listening(False)
                 _window.set_status("No speech detected", "#FFA500")
             return
 
         logger.info("User said: %r", transcript)
         if _window:
             _window.add_message("You", transcript)
-            _window.set_listening(False)
+            _window.set_state("thinking")
 
-        _handle_llm_response(transcript)
+        # Hand off to the interaction worker so the wake-word thread is free
+        # again as soon as the utterance is transcribed.
+        _turn_q.put(transcript)
     finally:
-        _interaction_lock.release()
+        _capture_lock.release()
 
 
 def _on_text_input(text: str) -> None:
     """Called when the user sends text via the UI input field."""
-    if not _interaction_lock.acquire(blocking=False):
-        logger.debug("Text input ignored — interaction in progress.")
-        return
-    try:
-        tts.interrupt()
-        _handle_llm_response(text)
-    finally:
-        _interaction_lock.release()
+    _turn_q.put(text)
+
+
+def _interaction_worker() -> None:
+    """Answer queued user turns one at a time, in the order they arrived."""
+    # Turns queued while Donna is still starting are answered once she's ready.
+    _ready.wait()
+    while True:
+        text = _turn_q.get()
+        with _interaction_lock:
+            try:
+                tts.interrupt()
+                _handle_llm_response(text)
+            except Exception:
+                logger.exception("Interaction failed.")
 
 
 def _on_mic_toggle() -> None:
@@ -319,6 +368,11 @@ def _shutdown() -> None:
         _wake_engine.stop()
     if _scheduler:
         _scheduler.stop()
+    try:
+        conversation_db.flush()
+    except Exception:
+        logger.exception("Failed to flush pending conversation writes.")
+    close_thread_connections()
     if _window:
         _window.quit()
     sys.exit(0)
@@ -326,15 +380,27 @@ def _shutdown() -> None:
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def main() -> None:
-    global _window, _wake_engine, _scheduler
+def _startup_greeting() -> str:
+    hour = datetime.now().hour
+    if hour < 12:
+        return "Good morning. I'm back and ready to help. Let's pick up where we left off."
+    if hour < 17:
+        return "Good afternoon. Welcome back. I'm here to continue assisting you."
+    return "Good evening. I'm back on duty. Let's continue from where we were."
 
-    logger.info("Starting Donna…")
 
-    # 1. Databases
+def _initialise() -> None:
+    """Everything after the window is up; runs on a background thread."""
+    global _wake_engine, _scheduler
+
+    # 1. Databases, and start loading Whisper and Kokoro so the first wake
+    #    and the first reply aren't slow
     contacts_db.init_db()
     conversation_db.init_db()
+    threading.Thread(target=stt.prewarm, name="WhisperPrewarm", daemon=True).start()
+    threading.Thread(target=tts.prewarm, name="KokoroPrewarm", daemon=True).start()
     # Record app open and report prior activity for today
+    assistant_msgs: list[dict] = []
     try:
         conversation_db.record_app_event("opened")
         events = conversation_db.get_app_events_today()
@@ -346,67 +412,31 @@ def main() -> None:
                 "Donna already spoke today; last statements: %s",
                 [m["content"] for m in assistant_msgs[-5:]],
             )
-            if _window:
-                for m in assistant_msgs[-5:]:
-                    _window.add_message("Donna (earlier)", m["content"])
-    except Exception:
-        logger.exception("Failed to record or fetch today's app events/messages.")
-
-    # 2. Build UI (must happen on main thread before mainloop)
-    _window = DonnaWindow(
-        on_send_text=lambda t: threading.Thread(
-            target=_on_text_input, args=(t,), daemon=True
-        ).start(),
-        on_mic_toggle=_on_mic_toggle,
-        on_close=_shutdown,
-    )
-    # If Donna already spoke today, populate the UI with her recent statements
-    try:
-        assistant_msgs = conversation_db.get_assistant_messages_today()
-        if assistant_msgs:
+            # Populate the UI with her recent statements
             for m in assistant_msgs[-5:]:
                 _window.add_message("Donna (earlier)", m["content"])
     except Exception:
-        logger.exception("Failed to populate UI with today's assistant messages.")
+        logger.exception("Failed to record or fetch today's app events/messages.")
 
     # If Donna already spoke today, greet the user and indicate we're picking up where we left off
-    try:
-        from datetime import datetime
-        assistant_msgs = conversation_db.get_assistant_messages_today()
-        if assistant_msgs:
-            hour = datetime.now().hour
-            if hour < 12:
-                greeting = "Good morning. I'm back and ready to help. Let's pick up where we left off."
-            elif hour < 17:
-                greeting = "Good afternoon. Welcome back. I'm here to continue assisting you."
-            else:
-                greeting = "Good evening. I'm back on duty. Let's continue from where we were."
-            
+    if assistant_msgs:
+        try:
+            greeting = _startup_greeting()
             logger.info("Donna startup greeting: %s", greeting)
-            if _window:
-                _window.add_message("Donna", greeting)
+            _window.add_message("Donna", greeting)
             tts.speak(greeting, block=False)
             try:
                 conversation_db.save_message("assistant", greeting)
             except Exception:
                 logger.exception("Failed to save startup greeting to DB.")
-    except Exception:
-        logger.exception("Failed to deliver startup greeting.")
-
-    # 3. System tray
-    tray = SystemTray(
-        on_show_window=_on_show_window,
-        on_hide_window=_on_hide_window,
-        on_exit=_on_tray_exit,
-        on_toggle_mute=_on_mic_toggle,
-    )
-    tray.start_threaded()
+        except Exception:
+            logger.exception("Failed to deliver startup greeting.")
 
-    # 4. Proactive scheduler
+    # 2. Proactive scheduler
     _scheduler = ProactiveScheduler(on_response=_on_proactive_response)
     _scheduler.start()
 
-    # 5. Wake word engine
+    # 3. Wake word engine
     wake_model_exists = Path(WAKE_WORD_MODEL_PATH).exists()
     pico_key_set = bool(PICOVOICE_ACCESS_KEY)
 
@@ -427,8 +457,58 @@ def main() -> None:
             "and train a 'Hey Donna' model at console.picovoice.ai."
         )
 
-    # 6. Enter main event loop (blocks until window is destroyed)
+    # 4. Warm the LLM module (Anthropic SDK) so the first reply isn't slowed
+    try:
+        from donna import llm  # noqa: F401
+    except Exception:
+        logger.exception("Failed to import the LLM module.")
+
+
+def _initialise_in_background() -> None:
+    try:
+        _initialise()
+    except Exception:
+        logger.exception("Startup failed.")
+        _window.set_status("Startup failed", "#FF4444")
+        return
+    finally:
+        _ready.set()
+    _window.set_status("Idle")
     logger.info("Donna is ready.")
+
+
+def main() -> None:
+    global _window
+
+    logger.info("Starting Donna…")
+
+    # 1. Build UI first (main thread — Tkinter requirement) so it appears
+    #    immediately; the slower start-up work runs behind it.
+    _window = DonnaWindow(
+        on_send_text=_on_text_input,
+        on_mic_toggle=_on_mic_toggle,
+        on_close=_shutdown,
+    )
+    _window.set_status("Starting…", "#FFA500")
+
+    # 2. System tray
+    tray = SystemTray(
+        on_show_window=_on_show_window,
+        on_hide_window=_on_hide_window,
+        on_exit=_on_tray_exit,
+        on_toggle_mute=_on_mic_toggle,
+    )
+    tray.start_threaded()
+
+    # 3. Databases, greeting, scheduler and wake word
+    threading.Thread(
+        target=_initialise_in_background, name="DonnaInit", daemon=True
+    ).start()
+    threading.Thread(
+        target=_interaction_worker, name="Interaction", daemon=True
+    ).start()
+
+    # 4. Enter main event loop (blocks until window is destroyed)
     _window.mainloop()
 
 
@@ -10,17 +10,20 @@ All jobs dispatch through llm.chat() and route the response back to the
 UI window and TTS engine via the callback registered with start().
 """
 
+import functools
+import heapq
+import itertools
 import logging
 import threading
 from datetime import datetime, timedelta, date, timezone
-from typing import Callable
+from typing import Any, Callable
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 
 from donna.config import MEETING_PREP_MINUTES
-from donna.db import conversation_db
+from donna.db import contacts_db, conversation_db
 
 logger = logging.getLogger(__name__)
 
@@ -29,20 +32,87 @@ _morning_brief_dates: set[date] = set()
 _lock = threading.Lock()
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_rfc3339(value: str) -> datetime:
+    """Parse a Calendar start time; naive values (all-day dates) are taken as UTC."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+# ─── Background job queue ─────────────────────────────────────────────────────
+
+# Lower runs first when several proactive jobs are waiting.
+_JOB_PRIORITY = {"meeting_prep": 0, "morning_brief": 1, "followups": 2}
+
+
+class _BackgroundQueue:
+    """
+    Runs proactive LLM jobs one at a time on a single worker thread, most
+    urgent kind first, so a burst of scheduler work never has several Claude
+    calls (and spoken replies) competing with the user's own interaction.
+    Jobs with a deadline that has already passed when they reach the front
+    are dropped — a meeting-prep alert is useless once the meeting started.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple] = []
+        self._seq = itertools.count()  # FIFO within a priority
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        deadline: datetime | None = None,
+    ) -> None:
+        with self._cond:
+            heapq.heappush(
+                self._heap, (_JOB_PRIORITY[kind], next(self._seq), kind, deadline, fn, args)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="ProactiveJobs"
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                _prio, _seq, kind, deadline, fn, args = heapq.heappop(self._heap)
+            if deadline is not None and datetime.now(timezone.utc) >= deadline:
+                logger.info("Dropping %s job that missed its deadline.", kind)
+                continue
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Proactive %s job failed.", kind)
+
+
 class ProactiveScheduler:
     """
     Wraps APScheduler and owns all of Donna's proactive trigger logic.
 
     Args:
         on_response: Callback invoked with the LLM response text whenever a
-                     proactive message is generated.  Typically wires to TTS
-                     and the UI window.
+                     proactive message is generated, plus a `dedupe_key`
+                     naming what it is about (or None).  Typically wires to
+                     TTS and the UI window.
     """
 
-    def __init__(self, on_response: Callable[[str], None]):
+    def __init__(self, on_response: Callable[..., None]):
         self._on_response = on_response
         self._scheduler = BackgroundScheduler(timezone="UTC")
         self._scheduled_event_ids: set[str] = set()
+        self._background = _BackgroundQueue()
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
@@ -57,7 +127,7 @@ class ProactiveScheduler:
         )
         # Morning brief check: run at 07:00 UTC and also at startup (see below)
         self._scheduler.add_job(
-            self._job_morning_brief,
+            self._queue_morning_brief,
             trigger=CronTrigger(hour=7, minute=0),
             id="morning_brief",
             replace_existing=True,
@@ -67,9 +137,7 @@ class ProactiveScheduler:
         logger.info("ProactiveScheduler started.")
 
         # Attempt morning brief immediately at startup
-        threading.Thread(
-            target=self._job_morning_brief, daemon=True, name="InitialBrief"
-        ).start()
+        self._queue_morning_brief()
         # Also seed meeting-prep jobs for today
         threading.Thread(
             target=self._job_hourly_sync, daemon=True, name="InitialSync"
@@ -82,6 +150,9 @@ class ProactiveScheduler:
 
     # ── Jobs ──────────────────────────────────────────────────────────────────
 
+    def _queue_morning_brief(self) -> None:
+        self._background.submit("morning_brief", self._job_morning_brief)
+
     def _job_morning_brief(self) -> None:
         today = date.today()
         with _lock:
@@ -94,14 +165,22 @@ class ProactiveScheduler:
             from donna.llm import morning_brief
             text = morning_brief()
             if text:
-                self._on_response(text)
+                self._on_response(text, dedupe_key=f"morning_brief:{today.isoformat()}")
         except Exception:
             logger.exception("Morning brief job failed.")
 
     def _job_hourly_sync(self) -> None:
-        """Refresh meeting-prep alerts and surface follow-ups."""
+        """Refresh meeting-prep alerts, surface follow-ups, checkpoint the WALs."""
         self._schedule_meeting_prep_alerts()
-        self._surface_followups()
+        self._background.submit("followups", self._surface_followups)
+        self._checkpoint_databases()
+
+    def _checkpoint_databases(self) -> None:
+        try:
+            conversation_db.checkpoint()
+            contacts_db.checkpoint()
+        except Exception:
+            logger.exception("WAL checkpoint failed.")
 
     def _schedule_meeting_prep_alerts(self) -> None:
         """
@@ -125,19 +204,20 @@ class ProactiveScheduler:
                 if not start_str:
                     continue
                 try:
-                    # Parse RFC3339 — strip trailing Z if present
-                    event_start = datetime.fromisoformat(start_str.rstrip("Z")).replace(
-                        tzinfo=timezone.utc
-                    )
+                    event_start = _parse_rfc3339(start_str)
                 except ValueError:
                     continue
                 alert_time = event_start - timedelta(minutes=MEETING_PREP_MINUTES)
                 if alert_time <= now:
-                    continue  # Already past the alert window
+                    # Already past the alert window; remember it so later
+                    # syncs skip it without parsing again.
+                    self._scheduled_event_ids.add(event_id)
+                    continue
                 self._scheduler.add_job(
-                    self._meeting_prep_alert,
+                    self._background.submit,
                     trigger=DateTrigger(run_date=alert_time),
-                    args=[event],
+                    args=["meeting_prep", self._meeting_prep_alert, event],
+                    kwargs={"deadline": event_start},
                     id=f"meeting_prep_{event_id}",
                     replace_existing=True,
                 )
@@ -162,10 +242,10 @@ class ProactiveScheduler:
             "recent emails from attendees, and anything I should know."
         )
         try:
-            from donna.llm import chat
-            response = chat(prompt)
+            from donna.llm import cached_chat
+            response = cached_chat(prompt, scope="meeting_prep")
             if response:
-                self._on_response(response)
+                self._on_response(response, dedupe_key=f"meeting_prep:{event.get('id')}")
         except Exception:
             logger.exception("Meeting prep alert failed for event %s.", event.get("id"))
 
@@ -184,12 +264,10 @@ class ProactiveScheduler:
             # Look for intent keywords in past sessions
             keywords = ["i need to call", "remind me", "follow up", "i should email",
                         "i'll email", "i'll call", "don't let me forget"]
-            followup_snippets: list[str] = []
-            for keyword in keywords:
-                hits = conversation_db.search_history(keyword, limit=3)
-                for hit in hits:
-                    if hit.get("session_id") != current_session:
-                        followup_snippets.append(hit["content"][:200])
+            hits = conversation_db.search_history_any(
+                keywords, limit=5, exclude_session=current_session
+            )
+            followup_snippets = [hit["content"][:200] for hit in hits]
 
             if not followup_snippets:
                 return
@@ -201,8 +279,8 @@ class ProactiveScheduler:
                 "Briefly and naturally remind the user of these outstanding items. "
                 "Keep it to 2–3 sentences."
             )
-            from donna.llm import chat
-            response = chat(prompt)
+            from donna.llm import cached_chat
+            response = cached_chat(prompt, scope="followups")
             if response:
                 self._on_response(response)
         except Exception:
@@ -11,12 +11,12 @@ This module runs synchronously when called; the caller is responsible for
 threading if non-blocking operation is needed.
 """
 
+import atexit
 import logging
-import collections
-import struct
-import wave
-import io
+import os
+import queue
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable
 
 import pyaudio
@@ -27,6 +27,7 @@ from donna.config import (
     WHISPER_MODEL_SIZE,
     WHISPER_DEVICE,
     WHISPER_COMPUTE_TYPE,
+    WHISPER_BEAM_SIZE,
     VAD_MODE,
     VAD_SAMPLE_RATE,
     VAD_FRAME_DURATION_MS,
@@ -44,61 +45,242 @@ _whisper_model = None
 _whisper_lock = threading.Lock()
 
 
+def _whisper_device() -> tuple[str, str]:
+    """Resolve (device, compute_type), preferring CUDA tensor cores when present."""
+    device = WHISPER_DEVICE
+    if device == "auto":
+        try:
+            import ctranslate2  # type: ignore
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        except Exception:
+            device = "cpu"
+    compute_type = WHISPER_COMPUTE_TYPE or ("int8_float16" if device == "cuda" else "int8")
+    return device, compute_type
+
+
 def _get_whisper():
     global _whisper_model
     if _whisper_model is None:
         with _whisper_lock:
             if _whisper_model is None:
                 from faster_whisper import WhisperModel  # type: ignore
+                device, compute_type = _whisper_device()
                 logger.info(
-                    "Loading Whisper model '%s' on %s…",
+                    "Loading Whisper model '%s' on %s (%s)…",
                     WHISPER_MODEL_SIZE,
-                    WHISPER_DEVICE,
+                    device,
+                    compute_type,
                 )
+                kwargs = {}
+                if device == "cpu":
+                    kwargs["cpu_threads"] = os.cpu_count() or 0
                 _whisper_model = WhisperModel(
                     WHISPER_MODEL_SIZE,
-                    device=WHISPER_DEVICE,
-                    compute_type=WHISPER_COMPUTE_TYPE,
+                    device=device,
+                    compute_type=compute_type,
+                    **kwargs,
                 )
                 logger.info("Whisper model loaded.")
     return _whisper_model
 
 
+# Greedy (by default), context-free decoding: utterances are short
+# single-speaker commands, where beam search costs several times the decode
+# work for no practical accuracy gain.
+_DECODE_OPTIONS = dict(
+    beam_size=WHISPER_BEAM_SIZE,
+    best_of=1,
+    temperature=0.0,
+    language="en",
+    task="transcribe",
+    vad_filter=False,  # we already did VAD
+    condition_on_previous_text=False,
+    without_timestamps=True,
+)
+
+
+def prewarm() -> None:
+    """
+    Load the Whisper model and run one silent decode so the first real
+    utterance doesn't pay for model load and first-inference setup.
+    Uses the same decode options as transcribe() so the same kernels and
+    buffers are set up.
+    """
+    try:
+        model = _get_whisper()
+        segments, _info = model.transcribe(
+            np.zeros(VAD_SAMPLE_RATE, dtype=np.float32), **_DECODE_OPTIONS
+        )
+        list(segments)  # segments are lazy; decoding happens on iteration
+        logger.info("Whisper model warmed up.")
+    except Exception:
+        logger.exception("Whisper pre-warm failed; it will load on first use.")
+
+
+# ─── Cached VAD ───────────────────────────────────────────────────────────────
+
+_vad_cache: dict[int, webrtcvad.Vad] = {}
+_vad_lock = threading.Lock()
+
+
+def get_vad(mode: int = VAD_MODE) -> webrtcvad.Vad:
+    """Return a shared webrtcvad.Vad for `mode` (the sample rate is per call)."""
+    vad = _vad_cache.get(mode)
+    if vad is None:
+        with _vad_lock:
+            vad = _vad_cache.get(mode)
+            if vad is None:
+                vad = _vad_cache[mode] = webrtcvad.Vad(mode)
+    return vad
+
+
 # ─── Audio helpers ────────────────────────────────────────────────────────────
 
 def _frame_duration_to_samples(duration_ms: int, sample_rate: int) -> int:
     return int(sample_rate * duration_ms / 1000)
 
 
-def _pcm_to_wav_bytes(pcm_frames: list[bytes], sample_rate: int) -> bytes:
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(AUDIO_CHANNELS)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-        wf.writeframes(b"".join(pcm_frames))
-    return buf.getvalue()
-
+# One VAD frame, fixed by config
+_FRAME_SAMPLES = _frame_duration_to_samples(VAD_FRAME_DURATION_MS, VAD_SAMPLE_RATE)
+_FRAME_BYTES = _FRAME_SAMPLES * 2  # 16-bit = 2 bytes per sample
 
-# ─── VAD-gated recording ─────────────────────────────────────────────────────
 
-def record_until_silence(
-    timeout_seconds: float = 15.0,
-    stop_flag: threading.Event | None = None,
-    silence_frames_override: int | None = None,
-) -> bytes | None:
+def pcm16_to_float32(pcm: bytes | memoryview) -> np.ndarray:
     """
-    Record from the default mic until VAD detects end-of-speech.
+    Convert mono 16-bit PCM to the float32 samples in [-1, 1) that
+    faster-whisper takes directly, avoiding a WAV encode/decode round-trip.
+    The result is a new array, so `pcm` may be reused afterwards.
+    """
+    audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    audio *= 1.0 / 32768.0
+    return audio
 
-    Returns:
-        Raw WAV bytes ready for Whisper, or None if no speech detected /
-        timeout reached / stop_flag was set.
+
+class _FramePool:
+    """
+    Recycles the PCM buffers recordings are captured into, so each utterance
+    is written into one preallocated bytearray instead of a list of per-frame
+    bytes objects that then has to be joined.
     """
-    vad = webrtcvad.Vad(VAD_MODE)
-    frame_samples = _frame_duration_to_samples(VAD_FRAME_DURATION_MS, VAD_SAMPLE_RATE)
-    frame_bytes = frame_samples * 2  # 16-bit = 2 bytes per sample
 
-    pa = pyaudio.PyAudio()
+    def __init__(self) -> None:
+        self._free: queue.LifoQueue[bytearray] = queue.LifoQueue()
+
+    def acquire(self, size: int) -> bytearray:
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            return bytearray(size)
+        return buf if len(buf) >= size else bytearray(size)
+
+    def release(self, buf: bytearray) -> None:
+        self._free.put_nowait(buf)
+
+
+_frame_pool = _FramePool()
+
+
+# ─── Persistent capture stream ───────────────────────────────────────────────
+#
+# Opening a PortAudio device takes tens to hundreds of milliseconds and clips
+# the start of speech, so one input stream is opened on first use and only
+# started/stopped between recordings.  _capture_lock ensures a single recorder
+# owns it at a time.
+
+_pa: pyaudio.PyAudio | None = None
+_stream = None
+_capture_lock = threading.Lock()
+
+# Input device that produced audio on the first open (None = host default).
+# Later reopens, e.g. after a read failure, go straight to it and skip the
+# enumeration, warm-up and device scan.
+_input_device_index: int | None = None
+_input_device_selected = False
+
+
+def _pa_singleton() -> pyaudio.PyAudio:
+    global _pa
+    if _pa is None:
+        _pa = pyaudio.PyAudio()
+    return _pa
+
+
+def _reset_pa() -> pyaudio.PyAudio:
+    """Terminate and recreate the PortAudio instance (device recovery)."""
+    global _pa
+    if _pa is not None:
+        try:
+            _pa.terminate()
+        except Exception:
+            pass
+    _pa = pyaudio.PyAudio()
+    return _pa
+
+
+def _peak(raw: bytes) -> float:
+    """Peak absolute sample of a frame read as int16 (float32 as a fallback)."""
+    try:
+        samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32)
+    except Exception:
+        try:
+            samples = np.frombuffer(raw, dtype=np.float32).astype(np.float32)
+        except Exception:
+            return 0.0
+    return float(np.max(np.abs(samples))) if samples.size else 0.0
+
+
+def _capture_stream():
+    """Return the shared input stream, opening it on first use.  Caller holds _capture_lock."""
+    global _stream
+    if _stream is None:
+        _stream = _open_capture_stream()
+    return _stream
+
+
+def _close_capture() -> None:
+    global _stream, _pa
+    if _stream is not None:
+        try:
+            _stream.stop_stream()
+            _stream.close()
+        except Exception:
+            pass
+        _stream = None
+    if _pa is not None:
+        try:
+            _pa.terminate()
+        except Exception:
+            pass
+        _pa = None
+
+
+atexit.register(_close_capture)
+
+
+def _stream_kwargs() -> dict:
+    return dict(
+        format=pyaudio.paInt16,
+        channels=AUDIO_CHANNELS,
+        rate=VAD_SAMPLE_RATE,
+        input=True,
+        frames_per_buffer=_FRAME_SAMPLES,
+    )
+
+
+def _open_capture_stream():
+    global _input_device_index, _input_device_selected
+    pa = _pa_singleton()
+    if _input_device_selected:
+        kwargs = _stream_kwargs()
+        if _input_device_index is not None:
+            kwargs["input_device_index"] = _input_device_index
+        logger.info("Reopening STT stream on input device %s", _input_device_index)
+        try:
+            return pa.open(**kwargs)
+        except Exception:
+            logger.warning("Selected input device failed to reopen; selecting again.")
+            _input_device_selected = False
+
     # Diagnostic: log default device and device list to help diagnose silent input
     try:
         default_info = pa.get_default_input_device_info()
@@ -124,13 +306,8 @@ def record_until_silence(
 
     # If config specifies an input device index, use it (helps on multi-device systems)
     from donna.config import AUDIO_INPUT_DEVICE_INDEX
-    stream_kwargs = dict(
-        format=pyaudio.paInt16,
-        channels=AUDIO_CHANNELS,
-        rate=VAD_SAMPLE_RATE,
-        input=True,
-        frames_per_buffer=frame_samples,
-    )
+    stream_kwargs = _stream_kwargs()
+    device_index = AUDIO_INPUT_DEVICE_INDEX
     if AUDIO_INPUT_DEVICE_INDEX is not None:
         stream_kwargs["input_device_index"] = AUDIO_INPUT_DEVICE_INDEX
         logger.info("Opening STT stream using configured input device index %s", AUDIO_INPUT_DEVICE_INDEX)
@@ -140,23 +317,13 @@ def record_until_silence(
     stream = pa.open(**stream_kwargs)
 
     # Warm-up reads: some host APIs return silence for the very first frames
-    # after reopening the device. Read & inspect a few frames and, if they
+    # after opening the device. Read & inspect a few frames and, if they
     # appear all near-zero, attempt a single reopen to recover.
     try:
         warmup_zero = True
-        warmup_count = 3
-        for i in range(warmup_count):
-            wraw = stream.read(frame_samples, exception_on_overflow=False)
-            try:
-                wsamples = np.frombuffer(wraw, dtype=np.int16).astype(np.float32)
-            except Exception:
-                try:
-                    wsamples = np.frombuffer(wraw, dtype=np.float32).astype(np.float32)
-                except Exception:
-                    wsamples = np.array([], dtype=np.float32)
-            if wsamples.size and float(np.max(np.abs(wsamples))) >= 1.0:
+        for _ in range(3):
+            if _peak(stream.read(_FRAME_SAMPLES, exception_on_overflow=False)) >= 1.0:
                 warmup_zero = False
-            logger.debug("STT warmup frame %d rms_est=%.3f", i, float(np.sqrt(np.mean((wsamples.astype(np.float32)) ** 2))) if wsamples.size else 0.0)
 
         if warmup_zero:
             logger.warning("STT warmup detected near-zero input frames; retrying stream open once.")
@@ -166,11 +333,7 @@ def record_until_silence(
             except Exception:
                 pass
             # Recreate Pa and reopen stream
-            try:
-                pa.terminate()
-            except Exception:
-                pass
-            pa = pyaudio.PyAudio()
+            pa = _reset_pa()
             stream = pa.open(**stream_kwargs)
             logger.info("STT stream reopened after warmup retry.")
             # If we still get silent frames, try enumerating devices and
@@ -179,84 +342,156 @@ def record_until_silence(
             # systems where the default device index becomes inactive after
             # PyAudio/driver changes.
             try:
-                # Quick check after reopen
-                rraw = stream.read(frame_samples, exception_on_overflow=False)
-                try:
-                    r_samples = np.frombuffer(rraw, dtype=np.int16).astype(np.float32)
-                except Exception:
-                    try:
-                        r_samples = np.frombuffer(rraw, dtype=np.float32).astype(np.float32)
-                    except Exception:
-                        r_samples = np.array([], dtype=np.float32)
-                if not (r_samples.size and float(np.max(np.abs(r_samples))) >= 1.0):
+                if _peak(stream.read(_FRAME_SAMPLES, exception_on_overflow=False)) < 1.0:
                     logger.warning("STT stream still near-zero after reopen; scanning other input devices.")
                     try:
                         stream.stop_stream(); stream.close()
                     except Exception:
                         pass
-                    pa.terminate()
-                    pa = pyaudio.PyAudio()
-                    device_count = pa.get_device_count()
-                    found = False
-                    for di in range(device_count):
+                    pa = _reset_pa()
+                    stream = None
+                    # The device just opened twice without producing audio
+                    silent_index = device_index
+                    if silent_index is None:
+                        try:
+                            silent_index = pa.get_default_input_device_info().get("index")
+                        except Exception:
+                            pass
+                    scan_kwargs = {k: v for k, v in stream_kwargs.items() if k != "input_device_index"}
+                    for di in range(pa.get_device_count()):
                         try:
                             info = pa.get_device_info_by_index(di)
                         except Exception:
                             continue
-                        if info.get("maxInputChannels", 0) <= 0:
+                        if info.get("maxInputChannels", 0) <= 0 or di == silent_index:
+                            continue
+                        # Rejecting unsupported formats up front avoids a
+                        # full open/read/close cycle per unusable device.
+                        try:
+                            pa.is_format_supported(
+                                VAD_SAMPLE_RATE,
+                                input_device=di,
+                                input_channels=AUDIO_CHANNELS,
+                                input_format=pyaudio.paInt16,
+                            )
+                        except ValueError:
                             continue
                         logger.info("Trying input device %d: %r", di, info.get("name", ""))
                         try:
-                            test_stream = pa.open(input_device_index=di, **stream_kwargs)
-                            try:
-                                traw = test_stream.read(frame_samples, exception_on_overflow=False)
-                                try:
-                                    tsamples = np.frombuffer(traw, dtype=np.int16).astype(np.float32)
-                                except Exception:
-                                    try:
-                                        tsamples = np.frombuffer(traw, dtype=np.float32).astype(np.float32)
-                                    except Exception:
-                                        tsamples = np.array([], dtype=np.float32)
-                                if tsamples.size and float(np.max(np.abs(tsamples))) >= 1.0:
-                                    logger.info("Selected input device %d: %r", di, info.get("name", ""))
-                                    # Use this device for the main stream
-                                    try:
-                                        test_stream.stop_stream(); test_stream.close()
-                                    except Exception:
-                                        pass
-                                    stream = pa.open(input_device_index=di, **stream_kwargs)
-                                    found = True
-                                    break
-                            finally:
-                                try:
-                                    test_stream.stop_stream(); test_stream.close()
-                                except Exception:
-                                    pass
+                            test_stream = pa.open(input_device_index=di, **scan_kwargs)
                         except Exception:
                             continue
-                    if not found:
+                        if _peak(test_stream.read(_FRAME_SAMPLES, exception_on_overflow=False)) >= 1.0:
+                            logger.info("Selected input device %d: %r", di, info.get("name", ""))
+                            stream = test_stream
+                            device_index = di
+                            break
+                        try:
+                            test_stream.stop_stream(); test_stream.close()
+                        except Exception:
+                            pass
+                    if stream is None:
                         logger.warning("No alternative input device produced non-zero frames; continuing with current stream.")
+                        stream = pa.open(**stream_kwargs)
             except Exception:
                 logger.exception("Error during STT reopen/device-scan fallback.")
     except Exception:
         logger.exception("STT warmup check failed (continuing anyway).")
 
-    # Ring buffer for pre-speech padding (keeps ~300 ms before speech starts)
+    _input_device_index = device_index
+    _input_device_selected = True
+    return stream
+
+
+# ─── VAD-gated recording ─────────────────────────────────────────────────────
+
+def record_until_silence(
+    timeout_seconds: float = 15.0,
+    stop_flag: threading.Event | None = None,
+    silence_frames_override: int | None = None,
+    on_pause: Callable[[np.ndarray | None], None] | None = None,
+) -> np.ndarray | None:
+    """
+    Record from the default mic until VAD detects end-of-speech.
+
+    If `on_pause` is given it is called with the utterance so far once the
+    speaker has been quiet for _PAUSE_FRAMES, and with None if they then
+    carry on talking.
+
+    Returns:
+        Mono float32 samples at VAD_SAMPLE_RATE ready for Whisper, or None if
+        no speech detected / timeout reached / stop_flag was set.
+    """
+    vad = get_vad()
+
+    with _capture_lock:
+        stream = _capture_stream()
+        if stream.is_stopped():
+            stream.start_stream()
+        return _record_from_stream(
+            stream, vad, timeout_seconds, stop_flag, silence_frames_override, on_pause
+        )
+
+
+# Frames used to estimate the background noise floor at the start of a capture
+_NOISE_CALIBRATION_FRAMES = 5
+
+# STT_ENERGY_THRESHOLD is an RMS level; frames are compared by sum of squares.
+_SPEECH_ENERGY = np.int64(STT_ENERGY_THRESHOLD ** 2 * _FRAME_SAMPLES)
+# Noise floor never exceeds half the threshold RMS (a quarter of its energy)
+_NOISE_FLOOR_CAP = _SPEECH_ENERGY // 4
+
+# Check for an all-zero (dead) input once per this many frames (~300 ms)
+_ZERO_CHECK_EVERY = 10
+
+# Quiet frames after speech before on_pause fires (~300 ms)
+_PAUSE_FRAMES = max(1, 300 // VAD_FRAME_DURATION_MS)
+
+
+def _record_from_stream(
+    stream,
+    vad,
+    timeout_seconds: float,
+    stop_flag: threading.Event | None,
+    silence_frames_override: int | None,
+    on_pause: Callable[[np.ndarray | None], None] | None = None,
+) -> np.ndarray | None:
+    # Ring buffer for pre-speech padding (keeps ~300 ms before speech starts).
+    # Frames are written in place at pre_roll_off, wrapping around.
     padding_frames = 10
-    ring_buffer: collections.deque[bytes] = collections.deque(maxlen=padding_frames)
+    pre_roll = bytearray(padding_frames * _FRAME_BYTES)
+    pre_roll_off = 0
+    pre_roll_full = False
     triggered = False
-    voiced_frames: list[bytes] = []
     silence_count = 0
     total_frames = 0
     max_frames = int(timeout_seconds * 1000 / VAD_FRAME_DURATION_MS)
+    # Voiced audio is copied into one pooled buffer; write_off is its end.
+    pcm = _frame_pool.acquire(max_frames * _FRAME_BYTES)
+    write_off = 0
     # Allow caller to override how many consecutive silence frames are
     # required before declaring end-of-speech (useful for longer post-speech
     # silence windows).
     silence_target = (
         silence_frames_override if silence_frames_override is not None else VAD_SILENCE_FRAMES
     )
+    # A pause only matters if end-of-speech is still some way off.
+    if silence_target <= _PAUSE_FRAMES:
+        on_pause = None
+    paused = False
+
+    # Frames no louder than the room's noise floor can't be speech, so
+    # webrtcvad is only consulted above it.  The floor is the median energy of
+    # the first few frames, capped below the energy threshold so someone
+    # talking straight away can't raise it over their own voice.
+    noise_energy: list[np.int64] = []
+    noise_floor = np.int64(0)
+    # Reused widening buffer for the per-frame sum of squares
+    wide = np.empty(_FRAME_SAMPLES, dtype=np.int64)
 
     _vad_exc_logged = False
+    # Debug-only stats are computed eagerly, so skip them unless they'd be logged
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     try:
         logger.debug("VAD recording started.")
@@ -265,127 +500,132 @@ def record_until_silence(
                 logger.debug("STT recording cancelled by stop flag.")
                 return None
 
-            raw = stream.read(frame_samples, exception_on_overflow=False)
+            raw = stream.read(_FRAME_SAMPLES, exception_on_overflow=False)
             total_frames += 1
 
-            # Energy-based speech detection (works even if webrtcvad misbehaves)
-            # Read raw bytes and interpret as either int16 PCM or float32 PCM
-            # Some audio backends may return normalized float samples (-1..1).
-            try:
-                samples_raw = np.frombuffer(raw, dtype=np.int16)
-                samples = samples_raw.astype(np.float32)
-                raw_format = "int16"
-            except Exception:
-                # Fallback: try float32
-                try:
-                    samples = np.frombuffer(raw, dtype=np.float32).astype(np.float32)
-                    raw_format = "float32"
-                except Exception:
-                    samples = np.array([], dtype=~np.float32)
-                    raw_format = "unknown"
-
-            # If samples are floats in -1..1, scale to int16-equivalent units so
-            # STT_ENERGY_THRESHOLD continues to work (threshold expects ~300).
-            if samples.size > 0 and raw_format == "float32":
-                max_abs = float(np.max(np.abs(samples)))
-                if max_abs <= 1.1:  # likely normalized floats
-                    samples_for_rms = samples * 32768.0
-                    scaled = True
-                else:
-                    samples_for_rms = samples
-                    scaled = False
-            else:
-                samples_for_rms = samples
-                scaled = False
-
-            rms = float(np.sqrt(np.mean(samples_for_rms ** 2))) if samples_for_rms.size > 0 else 0.0
+            # Energy-based speech detection (works even if webrtcvad misbehaves).
+            # The stream is opened as paInt16, so the frame is read in place
+            # and its energy kept as a sum of squares in int64.
+            samples = np.frombuffer(raw, dtype=np.int16)
+            frame = wide[:samples.size]
+            np.copyto(frame, samples)
+            energy = frame @ frame
 
             if total_frames == 1:
                 logger.info(
-                    "STT stream first-frame RMS=%.3f  (0 → stream is silent/closed); frames=%d bytes=%d; threshold=%s; fmt=%s scaled=%s",
-                    rms,
-                    frame_samples,
+                    "STT stream first-frame RMS=%.3f  (0 → stream is silent/closed); frames=%d bytes=%d; threshold=%s",
+                    float(np.sqrt(energy / max(samples.size, 1))),
+                    _FRAME_SAMPLES,
                     len(raw),
                     STT_ENERGY_THRESHOLD,
-                    raw_format,
-                    scaled,
-                )
-                logger.debug(
-                    "STT first-sample stats: dtype=%s min=%s max=%s first5=%s",
-                    samples.dtype if samples.size else "none",
-                    float(samples.min()) if samples.size else None,
-                    float(samples.max()) if samples.size else None,
-                    samples[:5].tolist() if samples.size else [],
                 )
-            # If samples are effectively all zero, log a warning to indicate an input problem
-            if samples_for_rms.size > 0 and float(np.max(np.abs(samples_for_rms))) < 1.0:
+                if debug:
+                    logger.debug(
+                        "STT first-sample stats: min=%s max=%s first5=%s",
+                        int(samples.min()) if samples.size else None,
+                        int(samples.max()) if samples.size else None,
+                        samples[:5].tolist(),
+                    )
+            # An all-zero frame usually means the input device is wrong;
+            # sampling every _ZERO_CHECK_EVERY frames is enough to notice.
+            if total_frames % _ZERO_CHECK_EVERY == 1 and samples.size and not energy:
                 logger.warning(
-                    "STT frame contains near-zero samples (max abs < 1). This usually indicates the selected input device is silent or wrong."
+                    "STT frame contains only zero samples. This usually indicates the selected input device is silent or wrong."
                 )
 
-            is_speech = rms > STT_ENERGY_THRESHOLD
-            try:
-                is_speech = is_speech or vad.is_speech(raw, VAD_SAMPLE_RATE)
-            except Exception as exc:
-                if not _vad_exc_logged:
-                    logger.warning("webrtcvad raised on frame %d: %s", total_frames, exc)
-                    _vad_exc_logged = True
+            if total_frames <= _NOISE_CALIBRATION_FRAMES:
+                noise_energy.append(energy)
+                if total_frames == _NOISE_CALIBRATION_FRAMES:
+                    noise_floor = min(
+                        sorted(noise_energy)[len(noise_energy) // 2],
+                        _NOISE_FLOOR_CAP,
+                    )
+                    if debug:
+                        logger.debug(
+                            "STT noise floor RMS=%.3f", float(np.sqrt(noise_floor / _FRAME_SAMPLES))
+                        )
+
+            is_speech = energy > _SPEECH_ENERGY
+            if not is_speech and energy > noise_floor:
+                try:
+                    is_speech = vad.is_speech(raw, VAD_SAMPLE_RATE)
+                except Exception as exc:
+                    if not _vad_exc_logged:
+                        logger.warning("webrtcvad raised on frame %d: %s", total_frames, exc)
+                        _vad_exc_logged = True
 
             if not triggered:
-                ring_buffer.append(raw)
+                pre_roll[pre_roll_off:pre_roll_off + _FRAME_BYTES] = raw
+                pre_roll_off += _FRAME_BYTES
+                if pre_roll_off == len(pre_roll):
+                    pre_roll_off = 0
+                    pre_roll_full = True
                 if is_speech:
                     triggered = True
-                    voiced_frames.extend(ring_buffer)
-                    ring_buffer.clear()
+                    # Oldest frame first: once wrapped, it sits at pre_roll_off
+                    with memoryview(pre_roll) as ring:
+                        parts = (
+                            (ring[pre_roll_off:], ring[:pre_roll_off])
+                            if pre_roll_full else (ring[:pre_roll_off],)
+                        )
+                        for part in parts:
+                            pcm[write_off:write_off + len(part)] = part
+                            write_off += len(part)
                     silence_count = 0
             else:
-                voiced_frames.append(raw)
+                pcm[write_off:write_off + len(raw)] = raw
+                write_off += len(raw)
                 if is_speech:
                     silence_count = 0
+                    if paused:
+                        paused = False
+                        on_pause(None)
                 else:
                     silence_count += 1
+                    if on_pause and silence_count == _PAUSE_FRAMES:
+                        paused = True
+                        with memoryview(pcm) as view:
+                            on_pause(pcm16_to_float32(view[:write_off]))
                     if silence_count > silence_target:
                         logger.debug(
-                            "End-of-speech detected after %d voiced frames.", len(voiced_frames)
+                            "End-of-speech detected after %d voiced frames.",
+                            write_off // _FRAME_BYTES,
                         )
                         break
 
         logger.info(
             "VAD result: %d total frames, triggered=%s, %d voiced frames collected.",
-            total_frames, triggered, len(voiced_frames),
+            total_frames, triggered, write_off // _FRAME_BYTES,
         )
 
-        if not voiced_frames:
+        if not write_off:
             logger.info("No speech detected within timeout.")
             return None
 
-        return _pcm_to_wav_bytes(voiced_frames, VAD_SAMPLE_RATE)
+        with memoryview(pcm) as view:
+            return pcm16_to_float32(view[:write_off])
 
+    except Exception:
+        # A read failure usually means the device went away; reopen next time.
+        _close_capture()
+        raise
     finally:
-        stream.stop_stream()
-        stream.close()
-        pa.terminate()
+        _frame_pool.release(pcm)
+        if _stream is stream:
+            stream.stop_stream()
 
 
 # ─── Transcription ────────────────────────────────────────────────────────────
 
-def transcribe(wav_bytes: bytes) -> str:
+def transcribe(audio: np.ndarray) -> str:
     """
-    Transcribe WAV audio bytes using faster-whisper.
+    Transcribe mono float32 audio at 16 kHz using faster-whisper.
 
     Returns:
         Transcribed text, stripped and lowercased.
     """
     model = _get_whisper()
-    # faster-whisper accepts a file path or a file-like object
-    audio_io = io.BytesIO(wav_bytes)
-    segments, _info = model.transcribe(
-        audio_io,
-        beam_size=5,
-        language="en",
-        task="transcribe",
-        vad_filter=False,  # we already did VAD
-    )
+    segments, _info = model.transcribe(audio, **_DECODE_OPTIONS)
     text = " ".join(seg.text.strip() for seg in segments).strip()
     logger.info("Transcribed: %r", text)
     return text
@@ -409,7 +649,47 @@ def listen_and_transcribe(
     """
     if on_listening:
         on_listening()
-    wav = record_until_silence(timeout_seconds=timeout_seconds, stop_flag=stop_flag)
-    if not wav:
+    return record_and_transcribe(timeout_seconds=timeout_seconds, stop_flag=stop_flag)
+
+
+# ─── Speculative transcription ────────────────────────────────────────────────
+# The trailing silence that confirms end-of-speech is pure waiting, so Whisper
+# starts on the utterance as soon as the speaker pauses.  If they carry on
+# talking the early result is discarded and the next pause tries again.
+
+_transcribe_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WhisperEarly")
+
+
+def record_and_transcribe(
+    timeout_seconds: float = 15.0,
+    stop_flag: threading.Event | None = None,
+    silence_frames_override: int | None = None,
+) -> str:
+    """
+    Record until silence and transcribe, overlapping Whisper with the
+    end-of-speech wait.
+
+    Returns:
+        Transcribed text, or "" if nothing was detected.
+    """
+    pending: list[Future] = []
+
+    def _on_pause(audio: np.ndarray | None) -> None:
+        if pending:
+            pending.pop().cancel()
+        if audio is not None:
+            pending.append(_transcribe_pool.submit(transcribe, audio))
+
+    audio = record_until_silence(
+        timeout_seconds=timeout_seconds,
+        stop_flag=stop_flag,
+        silence_frames_override=silence_frames_override,
+        on_pause=_on_pause,
+    )
+    if audio is None:
+        if pending:
+            pending.pop().cancel()
         return ""
-    return transcribe(wav)
+    if pending:
+        return pending.pop().result()
+    return transcribe(audio)
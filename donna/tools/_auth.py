@@ -3,8 +3,11 @@ tools/_auth.py — Google OAuth 2.0 helper shared by Gmail and Calendar tools.
 """
 
 import logging
+import threading
 from pathlib import Path
 
+import google_auth_httplib2
+import httplib2
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
@@ -16,6 +19,15 @@ logger = logging.getLogger(__name__)
 
 _creds: Credentials | None = None
 
+# Socket timeout for Google API calls; httplib2 otherwise waits forever
+_HTTP_TIMEOUT_SECONDS = 30
+
+# Built service clients, per thread: the underlying httplib2 connection isn't
+# thread-safe and tool calls run on a thread pool.  A thread's clients share
+# one keep-alive AuthorizedHttp, so repeat calls skip the TLS handshake, and
+# are rebuilt whenever _get_credentials() hands out a new credentials object.
+_services = threading.local()
+
 
 def _get_credentials() -> Credentials:
     global _creds
@@ -45,6 +57,17 @@ def _get_credentials() -> Credentials:
 
 
 def get_google_service(api_name: str, api_version: str):
-    """Build and return an authenticated Google API service client."""
+    """Return an authenticated Google API service client, built once per thread."""
     creds = _get_credentials()
-    return build(api_name, api_version, credentials=creds, cache_discovery=False)
+    if getattr(_services, "creds", None) is not creds:
+        _services.creds = creds
+        _services.clients = {}
+        _services.http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT_SECONDS)
+        )
+    key = (api_name, api_version)
+    service = _services.clients.get(key)
+    if service is None:
+        service = build(api_name, api_version, http=_services.http, cache_discovery=False)
+        _services.clients[key] = service
+    return service
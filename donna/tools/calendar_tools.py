@@ -15,16 +15,30 @@ def _calendar():
     return get_google_service("calendar", "v3")
 
 
+# strptime fallback for forms fromisoformat may reject on older Pythons
+_DT_FALLBACK_FORMATS = ("%Y-%m-%d %H:%M",)
+
+
 def _parse_dt(dt_str: str) -> str:
-    """Normalise various date/datetime strings to RFC3339."""
-    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
-        try:
-            dt = datetime.strptime(dt_str, fmt)
-            return dt.replace(tzinfo=timezone.utc).isoformat()
-        except ValueError:
-            continue
-    # Assume already RFC3339
-    return dt_str
+    """Normalise various date/datetime strings to RFC3339 (naive values are UTC)."""
+    # Already a UTC RFC3339 timestamp (the usual form in tool calls): pass through
+    if len(dt_str) >= 20 and dt_str[10] == "T" and dt_str.endswith("Z"):
+        return dt_str
+    try:
+        dt = datetime.fromisoformat(dt_str.replace(" ", "T", 1))
+    except ValueError:
+        for fmt in _DT_FALLBACK_FORMATS:
+            try:
+                dt = datetime.strptime(dt_str, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            # Assume already RFC3339
+            return dt_str
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.isoformat()
 
 
 # ─── Read ─────────────────────────────────────────────────────────────────────
@@ -60,26 +74,76 @@ def get_calendar_events(
         )
         .execute()
     )
-    items = events_result.get("items", [])
-    results = []
-    for e in items:
-        start = e.get("start", {})
-        end = e.get("end", {})
-        results.append({
-            "id": e.get("id"),
-            "title": e.get("summary", "(no title)"),
-            "start": start.get("dateTime", start.get("date", "")),
-            "end": end.get("dateTime", end.get("date", "")),
-            "location": e.get("location", ""),
-            "description": e.get("description", "")[:500],
-            "attendees": [
-                a.get("email") for a in e.get("attendees", [])
-            ],
-            "status": e.get("status", ""),
-        })
+    return [_summarise_event(e) for e in events_result.get("items", [])]
+
+
+def get_calendar_events_multi(
+    ranges: list[dict],
+    calendar_id: str = "primary",
+    max_results: int = 20,
+) -> list[dict]:
+    """
+    Return calendar events for several date ranges using a single batched
+    HTTP request.
+
+    Args:
+        ranges:      List of {"start_date": ..., "end_date": ...} dicts, each
+                     as accepted by get_calendar_events.
+        calendar_id: Calendar to query (default 'primary').
+        max_results: Maximum events per range.
+
+    Returns:
+        One {"start_date", "end_date", "events"} dict per range, in the order
+        given.  A range whose request failed has an empty events list.
+    """
+    service = _calendar()
+    results = [
+        {"start_date": r["start_date"], "end_date": r["end_date"], "events": []}
+        for r in ranges
+    ]
+
+    def _collect(request_id: str, response: dict, exception) -> None:
+        if exception is not None:
+            logger.warning("Batched calendar read %s failed: %s", request_id, exception)
+            return
+        results[int(request_id)]["events"] = [
+            _summarise_event(e) for e in response.get("items", [])
+        ]
+
+    batch = service.new_batch_http_request(callback=_collect)
+    for i, r in enumerate(ranges):
+        batch.add(
+            service.events().list(
+                calendarId=calendar_id,
+                timeMin=_parse_dt(r["start_date"]),
+                timeMax=_parse_dt(r["end_date"]),
+                maxResults=max_results,
+                singleEvents=True,
+                orderBy="startTime",
+            ),
+            request_id=str(i),
+        )
+    batch.execute()
     return results
 
 
+def _summarise_event(e: dict) -> dict:
+    start = e.get("start", {})
+    end = e.get("end", {})
+    return {
+        "id": e.get("id"),
+        "title": e.get("summary", "(no title)"),
+        "start": start.get("dateTime", start.get("date", "")),
+        "end": end.get("dateTime", end.get("date", "")),
+        "location": e.get("location", ""),
+        "description": e.get("description", "")[:500],
+        "attendees": [
+            a.get("email") for a in e.get("attendees", [])
+        ],
+        "status": e.get("status", ""),
+    }
+
+
 # ─── Create ───────────────────────────────────────────────────────────────────
 
 def create_calendar_event(
@@ -140,13 +204,10 @@ def update_calendar_event(
         Updated event dict.
     """
     service = _calendar()
-    event = (
-        service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-    )
-    event.update(changes)
+    # PATCH sends only the changed fields: one round trip instead of GET + PUT.
     updated = (
         service.events()
-        .update(calendarId=calendar_id, eventId=event_id, body=event)
+        .patch(calendarId=calendar_id, eventId=event_id, body=changes)
         .execute()
     )
     logger.info("Calendar event updated: %s", event_id)
@@ -6,9 +6,10 @@ Uses rapidfuzz for fuzzy name matching so queries like
 """
 
 import logging
+import threading
 from typing import Optional
 
-from rapidfuzz import process as fuzz_process, fuzz
+from rapidfuzz import process as fuzz_process, fuzz, utils as fuzz_utils
 
 from donna.db import contacts_db
 
@@ -16,6 +17,29 @@ logger = logging.getLogger(__name__)
 
 _FUZZY_SCORE_CUTOFF = 60  # 0–100; lower = more permissive
 
+# (preprocessed names, ids) for fuzzy matching, loaded on first lookup and
+# dropped by any add/update/delete made through this module.
+_name_cache: tuple[list[str], list[int]] | None = None
+_name_cache_lock = threading.Lock()
+
+
+def _names_and_ids() -> tuple[list[str], list[int]]:
+    global _name_cache
+    with _name_cache_lock:
+        if _name_cache is None:
+            candidates = contacts_db.get_all_names_and_ids()
+            _name_cache = (
+                [fuzz_utils.default_process(c["full_name"]) for c in candidates],
+                [c["id"] for c in candidates],
+            )
+        return _name_cache
+
+
+def _invalidate_names() -> None:
+    global _name_cache
+    with _name_cache_lock:
+        _name_cache = None
+
 
 def lookup_contact(query: str) -> list[dict]:
     """
@@ -33,16 +57,24 @@ def lookup_contact(query: str) -> list[dict]:
         return results[:5]
 
     # Fuzzy fallback against all stored names
-    candidates = contacts_db.get_all_names_and_ids()
-    if not candidates:
+    names, ids = _names_and_ids()
+    if not names:
         return []
 
-    names = [c["full_name"] for c in candidates]
+    # Names are preprocessed once when cached, so only the query is processed
+    # here.  Bag-of-words matching suits "John from Microsoft"-style queries
+    # and is much cheaper than WRatio.
     matches = fuzz_process.extract(
-        query, names, scorer=fuzz.WRatio, limit=5, score_cutoff=_FUZZY_SCORE_CUTOFF
+        fuzz_utils.default_process(query),
+        names,
+        scorer=fuzz.token_set_ratio,
+        processor=None,
+        limit=5,
+        score_cutoff=_FUZZY_SCORE_CUTOFF,
     )
-    matched_ids = {candidates[m[2]]["id"] for m in matches}
-    return [contacts_db.get_contact_by_id(cid) for cid in matched_ids if cid]
+    # Best match first; dict.fromkeys drops duplicate ids but keeps the order
+    matched_ids = [cid for cid in dict.fromkeys(ids[m[2]] for m in matches) if cid]
+    return contacts_db.get_contacts_by_ids(matched_ids)
 
 
 def add_contact(
@@ -67,6 +99,7 @@ def add_contact(
         phone=phone,
         notes=notes,
     )
+    _invalidate_names()
     contact = contacts_db.get_contact_by_id(contact_id)
     logger.info("Contact added: id=%s name=%s", contact_id, full_name)
     return contact
@@ -83,7 +116,10 @@ def update_contact(contact_id: int, fields: dict) -> dict:
     Returns:
         Updated contact dict, or error dict if not found.
     """
+    renamed = "full_name" in fields
     success = contacts_db.update_contact(contact_id, fields)
+    if renamed:
+        _invalidate_names()
     if not success:
         return {"error": f"Contact {contact_id} not found or no changes made."}
     contact = contacts_db.get_contact_by_id(contact_id)
@@ -106,6 +142,7 @@ def delete_contact(contact_id: int) -> dict:
         {"deleted": True} or {"error": "..."}.
     """
     success = contacts_db.delete_contact(contact_id)
+    _invalidate_names()
     if not success:
         return {"error": f"Contact {contact_id} not found."}
     logger.info("Contact deleted: id=%s", contact_id)
@@ -9,7 +9,6 @@ import base64
 import logging
 import email as email_lib
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from typing import Optional
 
 from donna.tools._auth import get_google_service
@@ -17,6 +16,17 @@ from donna.tools._auth import get_google_service
 logger = logging.getLogger(__name__)
 
 
+# Requests per batch; Gmail accepts up to 100 but recommends staying at 50 or
+# below to avoid per-user rate limiting.
+_BATCH_LIMIT = 50
+# HTTP statuses worth retrying (rate limit, server errors) and how many times
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_NUM_RETRIES = 3
+
+# Per-message body cap in get_thread, to avoid huge context
+_MAX_BODY_CHARS = 4000
+
+
 def _gmail():
     return get_google_service("gmail", "v1")
 
@@ -42,25 +52,55 @@ def get_emails(query: str = "is:inbox", max_results: int = 10) -> list[dict]:
         .execute()
     )
     messages = result.get("messages", [])
-    summaries = []
-    for msg_ref in messages:
-        msg = (
+    # Fetch metadata for all messages in batched HTTP requests rather than one
+    # round trip each; results are slotted back into list order.
+    summaries: list[dict | None] = [None] * len(messages)
+
+    # Sub-requests that were throttled or hit a server error are retried
+    # individually afterwards, with the client's exponential backoff.
+    retry: list[int] = []
+
+    def _collect(request_id: str, msg: dict, exception) -> None:
+        if exception is not None:
+            if getattr(getattr(exception, "resp", None), "status", 0) in _RETRYABLE_STATUS:
+                retry.append(int(request_id))
+            else:
+                logger.warning("Fetching Gmail message %s failed: %s", request_id, exception)
+            return
+        summaries[int(request_id)] = _summarise_message(msg)
+
+    def _get(i: int):
+        return (
             service.users()
             .messages()
-            .get(userId="me", id=msg_ref["id"], format="metadata",
+            .get(userId="me", id=messages[i]["id"], format="metadata",
                  metadataHeaders=["Subject", "From", "Date"])
-            .execute()
         )
-        headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
-        summaries.append({
-            "id": msg["id"],
-            "thread_id": msg.get("threadId", ""),
-            "subject": headers.get("Subject", "(no subject)"),
-            "from": headers.get("From", ""),
-            "date": headers.get("Date", ""),
-            "snippet": msg.get("snippet", ""),
-        })
-    return summaries
+
+    for start in range(0, len(messages), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=_collect)
+        for i in range(start, min(start + _BATCH_LIMIT, len(messages))):
+            batch.add(_get(i), request_id=str(i))
+        batch.execute()
+
+    for i in retry:
+        try:
+            summaries[i] = _summarise_message(_get(i).execute(num_retries=_NUM_RETRIES))
+        except Exception as exc:
+            logger.warning("Fetching Gmail message %s failed after retries: %s", i, exc)
+    return [s for s in summaries if s is not None]
+
+
+def _summarise_message(msg: dict) -> dict:
+    headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
+    return {
+        "id": msg["id"],
+        "thread_id": msg.get("threadId", ""),
+        "subject": headers.get("Subject", "(no subject)"),
+        "from": headers.get("From", ""),
+        "date": headers.get("Date", ""),
+        "snippet": msg.get("snippet", ""),
+    }
 
 
 def get_thread(thread_id: str) -> dict:
@@ -76,27 +116,34 @@ def get_thread(thread_id: str) -> dict:
     )
     messages = []
     for msg in thread.get("messages", []):
-        headers = {h["name"]: h["value"] for h in msg.get("payload", {}).get("headers", [])}
-        body = _extract_body(msg.get("payload", {}))
+        payload = msg.get("payload", {})
+        headers = {h["name"]: h["value"] for h in payload.get("headers", [])}
         messages.append({
             "id": msg["id"],
             "from": headers.get("From", ""),
             "date": headers.get("Date", ""),
             "subject": headers.get("Subject", ""),
-            "body": body[:4000],  # cap to avoid huge context
+            "body": _extract_body(payload, _MAX_BODY_CHARS),
         })
     return {"thread_id": thread_id, "messages": messages}
 
 
-def _extract_body(payload: dict) -> str:
-    """Recursively extract plain-text body from a Gmail message payload."""
+def _extract_body(payload: dict, max_chars: int) -> str:
+    """
+    Recursively extract plain-text body from a Gmail message payload,
+    capped at `max_chars`.  Only enough base64 is decoded to fill the cap,
+    so long messages in a thread cost the same as short ones.
+    """
     mime_type = payload.get("mimeType", "")
     if mime_type == "text/plain":
         data = payload.get("body", {}).get("data", "")
-        return base64.urlsafe_b64decode(data + "==").decode("utf-8", errors="replace")
+        # A UTF-8 character is at most 4 bytes, and 4 base64 chars carry 3 bytes
+        data = data[: -(-max_chars * 4 // 3) * 4]
+        text = base64.urlsafe_b64decode(data + "==").decode("utf-8", errors="replace")
+        return text[:max_chars]
     if mime_type.startswith("multipart/"):
         for part in payload.get("parts", []):
-            text = _extract_body(part)
+            text = _extract_body(part, max_chars)
             if text:
                 return text
     return ""
@@ -127,7 +174,9 @@ def send_email(
         Dict with id and thread_id of the sent message.
     """
     service = _gmail()
-    mime = MIMEMultipart()
+    # No attachments are supported, so a single text part needs no multipart
+    # wrapper or boundary.
+    mime = MIMEText(body, "plain")
     mime["To"] = to
     mime["Subject"] = subject
     if cc:
@@ -135,7 +184,6 @@ def send_email(
     if reply_to_message_id:
         mime["In-Reply-To"] = reply_to_message_id
         mime["References"] = reply_to_message_id
-    mime.attach(MIMEText(body, "plain"))
 
     raw = base64.urlsafe_b64encode(mime.as_bytes()).decode()
     body_payload: dict = {"raw": raw}
@@ -7,14 +7,29 @@ for open source projects, documentation, etc.
 
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     requests = None
     BeautifulSoup = None
+    SoupStrainer = None
+
+# lxml's C parser is many times faster than the pure-Python html.parser
+try:
+    import lxml.html
+    from lxml import etree
+    _HTML_PARSER = "lxml"
+except ImportError:
+    lxml = None
+    _HTML_PARSER = "html.parser"
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +37,143 @@ logger = logging.getLogger(__name__)
 _USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
 
+def _make_session():
+    """One pooled session so repeat requests to a host skip the TLS handshake."""
+    session = requests.Session()
+    session.headers["User-Agent"] = _USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _make_session() if requests else None
+
+# fetch_url keeps at most 50 lines of text, which real pages reach well within
+# this much HTML; the rest of a large page is never downloaded or parsed.
+_MAX_FETCH_BYTES = 512 * 1024
+_FETCH_CHUNK_BYTES = 64 * 1024
+
+
+def _read_capped(resp, limit: int) -> bytes:
+    """Read at most `limit` bytes of a streamed response body."""
+    buf = bytearray()
+    for chunk in resp.iter_content(_FETCH_CHUNK_BYTES):
+        buf += chunk
+        if len(buf) >= limit:
+            break
+    return bytes(buf[:limit])
+
+
+# ─── Result cache ─────────────────────────────────────────────────────────────
+
+# The same query or page is often requested several times in one conversation.
+_CACHE_TTL_SECONDS = 300
+_CACHE_MAX_ENTRIES = 256
+
+# key → (expiry as time.monotonic(), result)
+_web_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_web_cache_lock = threading.Lock()
+
+
+def _cache_get(key: tuple) -> dict[str, Any] | None:
+    with _web_cache_lock:
+        hit = _web_cache.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            del _web_cache[key]
+            return None
+        return hit[1]
+
+
+def _cache_put(key: tuple, result: dict[str, Any]) -> None:
+    """Store a successful result; errors are never cached."""
+    now = time.monotonic()
+    with _web_cache_lock:
+        for k in [k for k, (exp, _r) in _web_cache.items() if exp <= now]:
+            del _web_cache[k]
+        # Dicts keep insertion order, so the first key is the oldest entry
+        while len(_web_cache) >= _CACHE_MAX_ENTRIES:
+            del _web_cache[next(iter(_web_cache))]
+        _web_cache[key] = (now + _CACHE_TTL_SECONDS, result)
+
+
+# ─── Parsing ──────────────────────────────────────────────────────────────────
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains `name`."""
+    return f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+if lxml is not None:
+    # Compiled once; each result is then read with three relative lookups.
+    _XP_RESULTS = etree.XPath(f"//*{_has_class('result')}")
+    _XP_TITLE = etree.XPath(f"(.//*{_has_class('result__title')})[1]")
+    _XP_URL = etree.XPath(f"(.//*{_has_class('result__url')})[1]")
+    _XP_SNIPPET = etree.XPath(f"string((.//*{_has_class('result__snippet')})[1])")
+
+
+def _squash(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _parse_results_lxml(content: bytes, max_results: int) -> list[dict]:
+    results = []
+    for node in _XP_RESULTS(lxml.html.fromstring(content)):
+        title_elem = _XP_TITLE(node)
+        url_elem = _XP_URL(node)
+        if not title_elem or not url_elem:
+            continue
+        results.append({
+            "title": _squash(title_elem[0].text_content()),
+            "url": url_elem[0].get("href", ""),
+            "snippet": _squash(_XP_SNIPPET(node))[:200],  # Limit snippet length
+        })
+        if len(results) >= max_results:
+            break
+    return results
+
+
+def _parse_results_bs4(content: bytes, max_results: int) -> list[dict]:
+    soup = BeautifulSoup(content, _HTML_PARSER)
+    results = []
+    for result in soup.select(".result"):
+        try:
+            title_elem = result.select_one(".result__title")
+            url_elem = result.select_one(".result__url")
+            snippet_elem = result.select_one(".result__snippet")
+
+            if title_elem and url_elem:
+                title = title_elem.get_text(strip=True)
+                url = url_elem.get("href", "")
+                snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
+
+                results.append({
+                    "title": title,
+                    "url": url,
+                    "snippet": snippet[:200],  # Limit snippet length
+                })
+
+                if len(results) >= max_results:
+                    break
+        except Exception:
+            continue
+    return results
+
+
+# ─── Tools ────────────────────────────────────────────────────────────────────
+
+
 def web_search(query: str, max_results: int = 5) -> dict[str, Any]:
     """
     Search the web for information and return top results with links and summaries.
@@ -39,46 +191,33 @@ def web_search(query: str, max_results: int = 5) -> dict[str, Any]:
     if not requests:
         return {"error": "requests library not installed"}
 
+    key = ("search", query, max_results)
+    cached = _cache_get(key)
+    if cached is not None:
+        logger.info("Web search for %r served from cache", query)
+        return cached
+
     try:
         # Use DuckDuckGo's search endpoint
         url = "https://duckduckgo.com/html"
         params = {"q": query}
-        headers = {"User-Agent": _USER_AGENT}
 
-        resp = requests.get(url, params=params, headers=headers, timeout=10)
+        resp = _SESSION.get(url, params=params, timeout=10)
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.content, "html.parser")
-        results = []
-
         # Parse DuckDuckGo results
-        for result in soup.select(".result"):
-            try:
-                title_elem = result.select_one(".result__title")
-                url_elem = result.select_one(".result__url")
-                snippet_elem = result.select_one(".result__snippet")
-
-                if title_elem and url_elem:
-                    title = title_elem.get_text(strip=True)
-                    url = url_elem.get("href", "")
-                    snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-
-                    results.append({
-                        "title": title,
-                        "url": url,
-                        "snippet": snippet[:200],  # Limit snippet length
-                    })
-
-                    if len(results) >= max_results:
-                        break
-            except Exception:
-                continue
+        if lxml is not None:
+            results = _parse_results_lxml(resp.content, max_results)
+        else:
+            results = _parse_results_bs4(resp.content, max_results)
 
         if not results:
             return {"error": f"No results found for '{query}'"}
 
         logger.info("Web search for %r returned %d results", query, len(results))
-        return {"query": query, "results": results}
+        result = {"query": query, "results": results}
+        _cache_put(key, result)
+        return result
 
     except Exception as e:
         logger.exception("Web search failed for query %r", query)
@@ -101,12 +240,24 @@ def fetch_url(url: str, max_length: int = 2000) -> dict[str, Any]:
     if not requests or not BeautifulSoup:
         return {"error": "requests or beautifulsoup4 library not installed"}
 
-    try:
-        headers = {"User-Agent": _USER_AGENT}
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
+    key = ("fetch", url, max_length)
+    cached = _cache_get(key)
+    if cached is not None:
+        logger.info("Fetched URL %r from cache", url)
+        return cached
 
-        soup = BeautifulSoup(resp.content, "html.parser")
+    try:
+        with _SESSION.get(url, timeout=10, stream=True) as resp:
+            resp.raise_for_status()
+            html = _read_capped(resp, _MAX_FETCH_BYTES)
+
+        # Only the title and body are used, so <head> scripts, styles and
+        # metadata are never built into the tree.
+        soup = BeautifulSoup(
+            html,
+            _HTML_PARSER,
+            parse_only=SoupStrainer(["title", "article", "main", "body"]),
+        )
 
         # Remove script and style elements
         for script in soup(["script", "style"]):
@@ -137,17 +288,38 @@ def fetch_url(url: str, max_length: int = 2000) -> dict[str, Any]:
             content = content[:max_length] + "…"
 
         logger.info("Fetched URL %r: %d chars", url, len(content))
-        return {
+        result = {
             "url": url,
             "title": title,
             "content": content,
         }
+        _cache_put(key, result)
+        return result
 
     except Exception as e:
         logger.exception("Failed to fetch URL %r", url)
         return {"error": f"Failed to fetch URL: {str(e)}"}
 
 
+# Matches the session's pool size so concurrent fetches never queue for a socket.
+_fetch_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="FetchUrl")
+
+
+def fetch_urls(urls: list[str], max_length: int = 2000) -> dict[str, Any]:
+    """
+    Fetch several web pages concurrently.
+
+    Args:
+        urls: URLs to fetch
+        max_length: Maximum length of returned text per page (chars)
+
+    Returns:
+        Dict with 'pages', one fetch_url result per URL in the given order.
+    """
+    pages = list(_fetch_pool.map(lambda u: fetch_url(u, max_length), urls))
+    return {"pages": pages}
+
+
 def search_opensource(query: str, max_results: int = 5) -> dict[str, Any]:
     """
     Search for open source projects, libraries, and documentation.
@@ -9,6 +9,7 @@ Features:
 """
 
 import re
+import queue
 import threading
 import logging
 import numpy as np
@@ -18,6 +19,42 @@ import sounddevice as sd
 from donna.config import TTS_VOICE, TTS_SPEED
 
 
+# ─── TTS text sanitising ──────────────────────────────────────────────────────
+# Patterns are compiled once; sanitize_for_tts runs before every spoken reply.
+
+_RE_CODE_BLOCK  = re.compile(r"```[\s\S]*?```")
+_RE_INLINE_CODE = re.compile(r"`[^`]*`")
+_RE_HEADER      = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+# Bold + italic (***text*** / ___text___) then bold then italic, in this order
+_RE_EMPHASIS = tuple(
+    re.compile(p, re.DOTALL)
+    for p in (
+        r"\*{3}(.+?)\*{3}",
+        r"_{3}(.+?)_{3}",
+        r"\*{2}(.+?)\*{2}",
+        r"_{2}(.+?)_{2}",
+        r"\*(.+?)\*",
+        r"_(.+?)_",
+    )
+)
+_RE_LINK     = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_RE_HR       = re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE)
+_RE_BULLET   = re.compile(r"^\s*[-*]\s+", re.MULTILINE)
+_RE_NUMBERED = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+# Misc Symbols (2600-26FF), Dingbats (2700-27BF), Supplemental Symbols
+# (1F000-1FFFF) and variation selectors, in one character class
+_RE_EMOJI = re.compile("[\u2600-\u27BF\U0001F000-\U0001FFFF\uFE00-\uFE0F]")
+# Em/en dashes → natural pause, in one translate pass
+_DASH_PAUSES = str.maketrans({"\u2014": ", ", "\u2013": ", "})
+_RE_TIME     = re.compile(r"\b(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)\b")
+_RE_BLANKS   = re.compile(r"\n{3,}")
+
+
+def _fmt_time(m: re.Match) -> str:
+    hour, mins, ampm = m.group(1), m.group(2), m.group(3)
+    return f"{hour} {ampm.upper()}" if mins == "00" else f"{hour}:{mins} {ampm.upper()}"
+
+
 def sanitize_for_tts(text: str) -> str:
     """Strip markdown and normalise text so it reads naturally when spoken.
 
@@ -26,56 +63,39 @@ def sanitize_for_tts(text: str) -> str:
     Also normalises time strings so "6:00 PM" is spoken as "6 PM".
     """
     # ── Code blocks and inline code ──────────────────────────────────────────
-    text = re.sub(r"```[\s\S]*?```", "", text)
-    text = re.sub(r"`[^`]*`", "", text)
+    text = _RE_CODE_BLOCK.sub("", text)
+    text = _RE_INLINE_CODE.sub("", text)
 
     # ── Markdown headers (# Heading) ─────────────────────────────────────────
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    text = _RE_HEADER.sub("", text)
 
-    # ── Bold + italic (***text*** / ___text___) then bold then italic ─────────
-    text = re.sub(r"\*{3}(.+?)\*{3}", r"\1", text, flags=re.DOTALL)
-    text = re.sub(r"_{3}(.+?)_{3}", r"\1", text, flags=re.DOTALL)
-    text = re.sub(r"\*{2}(.+?)\*{2}", r"\1", text, flags=re.DOTALL)
-    text = re.sub(r"_{2}(.+?)_{2}", r"\1", text, flags=re.DOTALL)
-    text = re.sub(r"\*(.+?)\*", r"\1", text, flags=re.DOTALL)
-    text = re.sub(r"_(.+?)_", r"\1", text, flags=re.DOTALL)
+    # ── Bold + italic, bold, italic ──────────────────────────────────────────
+    for pattern in _RE_EMPHASIS:
+        text = pattern.sub(r"\1", text)
 
     # ── Markdown links [label](url) → label ──────────────────────────────────
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+    text = _RE_LINK.sub(r"\1", text)
 
     # ── Horizontal rules ─────────────────────────────────────────────────────
-    text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
+    text = _RE_HR.sub("", text)
 
     # ── Bullet list markers (- item / * item) ────────────────────────────────
-    text = re.sub(r"^\s*[-*]\s+", "", text, flags=re.MULTILINE)
+    text = _RE_BULLET.sub("", text)
 
     # ── Numbered list markers (1. item) ──────────────────────────────────────
-    text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
+    text = _RE_NUMBERED.sub("", text)
 
     # ── Emoji and pictographic symbols ───────────────────────────────────────
-    # Covers Misc Symbols (2600-26FF), Dingbats (2700-27BF),
-    # Supplemental Symbols (1F300-1F9FF), and variation selectors
-    text = re.sub(r"[\u2600-\u27BF]", "", text)
-    text = re.sub(r"[\U0001F000-\U0001FFFF]", "", text)
-    text = re.sub(r"[\uFE00-\uFE0F]", "", text)  # variation selectors
+    text = _RE_EMOJI.sub("", text)
 
     # ── Em/en dashes → natural pause ─────────────────────────────────────────
-    text = text.replace("\u2014", ", ")  # em dash —
-    text = text.replace("\u2013", ", ")  # en dash –
+    text = text.translate(_DASH_PAUSES)
 
     # ── Times: "6:00PM" / "6:00 PM" → "6 PM"; "6:30 PM" stays "6:30 PM" ────
-    def _fmt_time(m: re.Match) -> str:
-        hour, mins, ampm = m.group(1), m.group(2), m.group(3)
-        return f"{hour} {ampm.upper()}" if mins == "00" else f"{hour}:{mins} {ampm.upper()}"
-
-    text = re.sub(
-        r"\b(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)\b",
-        _fmt_time,
-        text,
-    )
+    text = _RE_TIME.sub(_fmt_time, text)
 
     # ── Collapse excess blank lines ───────────────────────────────────────────
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _RE_BLANKS.sub("\n\n", text)
 
     return text.strip()
 
@@ -88,6 +108,20 @@ _pipeline_lock = threading.Lock()
 # Global stop event — set to interrupt ongoing speech
 _stop_event = threading.Event()
 
+# Output streams currently playing an utterance; interrupt() aborts them
+_out_streams: set = set()
+_out_lock = threading.Lock()
+
+_SAMPLE_RATE = 24000  # Kokoro output is fixed at 24 kHz
+
+# Sentences queued by non-blocking speak() calls are played in order by a
+# single speaker thread.  Each item carries the generation it was queued in;
+# interrupt() bumps the generation so stale sentences are dropped.
+_speech_q: "queue.Queue[tuple[int, str, str, float]]" = queue.Queue()
+_speech_generation = 0
+_speaker_thread: threading.Thread | None = None
+_speaker_lock = threading.Lock()
+
 
 def _get_pipeline():
     global _pipeline
@@ -102,11 +136,26 @@ def _get_pipeline():
     return _pipeline
 
 
+def prewarm() -> None:
+    """
+    Load the Kokoro pipeline and synthesise one short phrase (discarded) so
+    the first real reply doesn't pay for model and voice load.
+    """
+    try:
+        pipeline = _get_pipeline()
+        for _gs, _ps, _audio in pipeline("Ready.", voice=TTS_VOICE, speed=TTS_SPEED):
+            pass
+        logger.info("Kokoro TTS warmed up.")
+    except Exception:
+        logger.exception("Kokoro pre-warm failed; it will load on first use.")
+
+
 def speak(
     text: str,
     voice: str | None = None,
     speed: float | None = None,
     block: bool = True,
+    enqueue: bool = False,
 ) -> None:
     """
     Synthesise `text` and play it through the default audio output.
@@ -116,7 +165,11 @@ def speak(
         voice: Kokoro voice ID (default: config TTS_VOICE).
         speed: Speech rate multiplier (default: config TTS_SPEED).
         block: If True, return only when playback is finished (or interrupted).
-               If False, launch in a background thread and return immediately.
+               If False, hand the text to the speaker thread and return
+               immediately.
+        enqueue: If True, queue `text` behind earlier enqueued text and return
+               immediately; use wait() to block until the queue has played.
+               Non-blocking calls always queue, so this implies block=False.
     """
     voice = voice or TTS_VOICE
     speed = speed if speed is not None else TTS_SPEED
@@ -125,9 +178,11 @@ def speak(
     if not text:
         return
 
-    if not block:
-        t = threading.Thread(target=_speak_blocking, args=(text, voice, speed), daemon=True)
-        t.start()
+    # Background speech goes through the one speaker thread, so utterances
+    # never overlap on the output device and no thread is spawned per call.
+    if enqueue or not block:
+        _ensure_speaker()
+        _speech_q.put((_speech_generation, text, voice, speed))
         return
 
     _speak_blocking(text, voice, speed)
@@ -138,32 +193,83 @@ def _speak_blocking(text: str, voice: str, speed: float) -> None:
     try:
         pipeline = _get_pipeline()
         # Kokoro KPipeline yields (graphemes, phonemes, audio_array) tuples.
-        # Sample rate is fixed at 24 kHz.
         generator = pipeline(text, voice=voice, speed=speed)
-        for _gs, _ps, audio in generator:
-            if _stop_event.is_set():
-                logger.debug("TTS interrupted.")
-                break
-
-            samples_np = np.array(audio, dtype=np.float32)
-            peak = np.abs(samples_np).max()
-            if peak > 1.0:
-                samples_np /= peak
-
-            sd.play(samples_np, samplerate=24000, blocking=True)
+        # One stream per utterance: write() returns once the chunk is
+        # buffered, so the next chunk is synthesised while this one plays,
+        # with no stream setup or gap between chunks.
+        with sd.OutputStream(
+            samplerate=_SAMPLE_RATE, channels=1, dtype="float32", blocksize=0
+        ) as stream:
+            with _out_lock:
+                _out_streams.add(stream)
+            try:
+                for _gs, _ps, audio in generator:
+                    if _stop_event.is_set():
+                        break
+
+                    # No copy when Kokoro already hands back float32; the peak
+                    # comes from two reductions rather than an abs() temporary.
+                    samples_np = np.asarray(audio, dtype=np.float32)
+                    peak = max(samples_np.max(), -samples_np.min()) if samples_np.size else 0.0
+                    if peak > 1.0:
+                        # Out of place: the array may share memory with Kokoro's tensor
+                        samples_np = samples_np * (1.0 / peak)
+
+                    try:
+                        stream.write(samples_np.reshape(-1, 1))
+                    except sd.PortAudioError:
+                        if _stop_event.is_set():
+                            break  # aborted by interrupt()
+                        raise
+            finally:
+                with _out_lock:
+                    _out_streams.discard(stream)
+        if _stop_event.is_set():
+            logger.debug("TTS interrupted.")
     except Exception:
         logger.exception("TTS playback error")
 
 
+def _ensure_speaker() -> None:
+    global _speaker_thread
+    if _speaker_thread is None:
+        with _speaker_lock:
+            if _speaker_thread is None:
+                _speaker_thread = threading.Thread(
+                    target=_speaker_loop, name="TTSSpeaker", daemon=True
+                )
+                _speaker_thread.start()
+
+
+def _speaker_loop() -> None:
+    while True:
+        generation, text, voice, speed = _speech_q.get()
+        try:
+            if generation == _speech_generation:
+                _speak_blocking(text, voice, speed)
+        finally:
+            _speech_q.task_done()
+
+
+def wait() -> None:
+    """Block until every enqueued sentence has been spoken or dropped."""
+    _speech_q.join()
+
+
 def interrupt() -> None:
     """Stop any ongoing speech immediately."""
+    global _speech_generation
+    _speech_generation += 1
     _stop_event.set()
-    try:
-        sd.stop()
-    except Exception:
-        pass
+    with _out_lock:
+        streams = list(_out_streams)
+    for stream in streams:
+        try:
+            stream.abort()
+        except Exception:
+            pass
 
 
 def is_speaking() -> bool:
     """Return True while audio is actively being played."""
-    return sd.get_stream() is not None and not _stop_event.is_set()
+    return bool(_out_streams) and not _stop_event.is_set()
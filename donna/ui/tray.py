@@ -8,6 +8,7 @@ The tray icon provides:
   - Exit
 """
 
+import functools
 import logging
 import threading
 from pathlib import Path
@@ -19,6 +20,7 @@ import pystray
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
 def _create_default_icon(size: int = 64) -> Image.Image:
     """Draw a simple 'D' on a dark purple circle as a fallback icon."""
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
@@ -30,10 +32,14 @@ def _create_default_icon(size: int = 64) -> Image.Image:
     return img
 
 
+@functools.lru_cache(maxsize=1)
 def _load_icon_image() -> Image.Image:
+    """Decoded once per process; later tray starts reuse the same image."""
     icon_path = Path(__file__).parent.parent.parent / "assets" / "donna_icon.png"
     if icon_path.exists():
-        return Image.open(str(icon_path))
+        img = Image.open(str(icon_path))
+        img.load()  # Decode now and release the file rather than lazily later
+        return img
     return _create_default_icon()
 
 
@@ -55,21 +61,24 @@ class SystemTray:
         self._icon: pystray.Icon | None = None
 
     def _make_menu(self) -> pystray.Menu:
-        mute_label = "Unmute Microphone" if self._muted else "Mute Microphone"
+        # Built once; the mute label is a callable pystray re-evaluates
         return pystray.Menu(
             pystray.MenuItem("Donna", None, enabled=False),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Show Window", self._handle_show),
             pystray.MenuItem("Hide Window", self._handle_hide),
             pystray.Menu.SEPARATOR,
-            pystray.MenuItem(mute_label, self._handle_toggle_mute),
+            pystray.MenuItem(self._mute_label, self._handle_toggle_mute),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Exit", self._handle_exit),
         )
 
+    def _mute_label(self, item) -> str:
+        return "Unmute Microphone" if self._muted else "Mute Microphone"
+
     def _refresh_menu(self) -> None:
+        # Backends such as Win32 only re-read dynamic labels on update_menu()
         if self._icon:
-            self._icon.menu = self._make_menu()
             self._icon.update_menu()
 
     # ── Handlers ──────────────────────────────────────────────────────────────
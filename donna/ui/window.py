@@ -15,11 +15,16 @@ Layout:
   └─────────────────────────────────────┘
 
 Thread safety: all UI mutations must happen on the main Tk thread.
-External code calls the public methods; the window queues them via after().
+External code calls the public methods; the window queues the updates and
+applies everything pending in one after() callback.
 """
 
 import logging
+import queue
 import threading
+import tkinter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Callable
 
@@ -45,6 +50,54 @@ _STATUS_IDLE = "#6B6B6B"
 _STATUS_ON   = "#4CAF50"
 _STATUS_ERR  = "#F44336"
 
+# Interaction states shown in the status indicator: state → (label, colour)
+_STATES = {
+    "idle":      ("Idle", _STATUS_IDLE),
+    "listening": ("Listening…", _STATUS_ON),
+    "thinking":  ("Thinking…", "#FFA500"),
+    "speaking":  ("Speaking…", "#2196F3"),
+}
+
+# Transcript history kept in the textbox.  Tk's insert/layout cost grows with
+# the widget's content, so old messages are pruned; the slack means pruning
+# happens in batches rather than on every append.
+_MAX_MESSAGES = 1000
+_PRUNE_SLACK = 200
+# Scroll position (fraction visible at the bottom) that still counts as
+# reading the latest messages
+_FOLLOW_TAIL = 0.98
+
+
+# Keys a read-only transcript still honours: scrolling, caret movement for
+# selection, and copy / select-all
+_READONLY_KEYS = frozenset({
+    "Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End",
+    "Shift_L", "Shift_R", "Control_L", "Control_R",
+})
+_READONLY_CTRL_KEYS = frozenset({"c", "a", "slash"})
+_CONTROL_MASK = 0x0004
+
+
+class _ReadOnlyText(tkinter.Text):
+    """
+    Text widget that rejects user edits but accepts programmatic inserts, so
+    appending doesn't need a state="normal"/"disabled" toggle around it.
+    """
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.bind("<Key>", self._filter_key)
+        for event in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.bind(event, lambda _e: "break")
+
+    @staticmethod
+    def _filter_key(event) -> str | None:
+        if event.keysym in _READONLY_KEYS:
+            return None
+        if event.state & _CONTROL_MASK and event.keysym.lower() in _READONLY_CTRL_KEYS:
+            return None
+        return "break"
+
 
 class DonnaWindow(ctk.CTk):
     """
@@ -64,6 +117,21 @@ class DonnaWindow(ctk.CTk):
         self._on_mic_toggle = on_mic_toggle
         self._on_close = on_close
         self._mic_active = False
+        # Sends are handed off the Tk thread to one reused worker, which also
+        # keeps them in the order they were typed.
+        self._send_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DonnaSend")
+        # Last interaction state posted to the Tk thread (None after a
+        # free-form set_status), so repeated set_state calls are no-ops.
+        self._state: str | None = None
+        self._state_lock = threading.Lock()
+        # Line count of each message in the transcript, oldest first
+        self._message_lines: deque[int] = deque()
+        # Pending updates from other threads: ("msg", speaker, text),
+        # ("status", text, colour) or ("agenda", text).  One drain callback
+        # is scheduled at a time, however many updates arrive.
+        self._ui_queue: queue.SimpleQueue[tuple] = queue.SimpleQueue()
+        self._drain_scheduled = False
+        self._drain_lock = threading.Lock()
 
         self._build_window()
         self._build_widgets()
@@ -124,15 +192,37 @@ class DonnaWindow(ctk.CTk):
         self._agenda_label.grid(row=1, column=0, sticky="ew")
 
         # ── Transcript area ──
-        self._transcript = ctk.CTkTextbox(
-            self,
+        # A plain tkinter.Text: CTkTextbox adds per-operation redraw overhead
+        # on the append path.  The CTk frame and scrollbar keep the look.
+        transcript_frame = ctk.CTkFrame(self, fg_color=_BG, corner_radius=6)
+        transcript_frame.grid(row=2, column=0, sticky="nsew", padx=6, pady=(4, 2))
+        transcript_frame.grid_columnconfigure(0, weight=1)
+        transcript_frame.grid_rowconfigure(0, weight=1)
+
+        self._transcript = _ReadOnlyText(
+            transcript_frame,
             font=("Segoe UI", 11),
-            fg_color=_BG,
-            text_color=_TEXT_FG,
+            bg=_BG,
+            fg=_TEXT_FG,
+            insertbackground=_TEXT_FG,
+            insertontime=0,  # no blinking caret in a read-only log
             wrap="word",
-            state="disabled",
+            bd=0,
+            highlightthickness=0,
+            spacing3=4,
+            undo=False,
+        )
+        self._transcript.grid(row=0, column=0, sticky="nsew", padx=(6, 0), pady=6)
+        self._transcript.tag_configure(
+            "speaker_you", foreground="#9A3FDE", font=("Segoe UI", 11, "bold")
         )
-        self._transcript.grid(row=2, column=0, sticky="nsew", padx=6, pady=(4, 2))
+        self._transcript.tag_configure(
+            "speaker_donna", foreground=_TEXT_FG, font=("Segoe UI", 11, "bold")
+        )
+
+        scrollbar = ctk.CTkScrollbar(transcript_frame, command=self._transcript.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self._transcript.configure(yscrollcommand=scrollbar.set)
 
         # ── Input row ──
         input_frame = ctk.CTkFrame(self, fg_color=_BG, corner_radius=0, height=44)
@@ -170,34 +260,102 @@ class DonnaWindow(ctk.CTk):
             return
         self._text_input.delete(0, "end")
         self.add_message("You", text)
-        threading.Thread(
-            target=self._on_send_text, args=(text,), daemon=True
-        ).start()
+        self._send_pool.submit(self._on_send_text, text)
 
     def _handle_mic_toggle(self) -> None:
         self._mic_active = not self._mic_active
         self._mic_btn.configure(fg_color=_ACCENT if self._mic_active else "#333355")
         self._on_mic_toggle()
 
-    # ── Public API (thread-safe via after()) ──────────────────────────────────
+    # ── UI update queue ───────────────────────────────────────────────────────
+
+    def _post(self, item: tuple) -> None:
+        self._ui_queue.put(item)
+        with self._drain_lock:
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        if item[0] == "msg":
+            self.after(0, self._drain_ui_queue)
+        else:
+            # Status and agenda changes are cosmetic; let pending redraws and
+            # input events go first.  A message queued meanwhile rides along.
+            self.after_idle(self._drain_ui_queue)
+
+    def _drain_ui_queue(self) -> None:
+        # Cleared before draining, so an update queued from here on schedules
+        # a fresh drain rather than being stranded.
+        with self._drain_lock:
+            self._drain_scheduled = False
+
+        messages: list[tuple[str, str]] = []
+        status = agenda = None
+        while True:
+            try:
+                item = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = item[0]
+            if kind == "msg":
+                messages.append(item[1:])
+            elif kind == "status":
+                status = item[1:]  # only the latest status is visible
+            elif kind == "agenda":
+                agenda = item[1]
+
+        if messages:
+            self._append_transcript(messages)
+        if status is not None:
+            self._set_status_main(*status)
+        if agenda is not None:
+            self._agenda_label.configure(text=f"  {agenda}")
+
+    def _append_transcript(self, messages: list[tuple[str, str]]) -> None:
+        """Insert a batch of (speaker, text) messages with one Text mutation."""
+        ts = datetime.now().strftime("%H:%M")
+        # Text.insert takes alternating chars/tags pairs, so the whole batch,
+        # speaker lines tagged, is still a single insert.
+        chunks: list[str] = []
+        for speaker, text in messages:
+            tag = "speaker_you" if speaker == "You" else "speaker_donna"
+            chunks += (f"\n[{ts}] {speaker}:\n", tag, f"{text}\n", "")
+            self._message_lines.append(text.count("\n") + 3)
+
+        # Only follow new messages if the user hasn't scrolled up to read
+        follow = self._transcript.yview()[1] >= _FOLLOW_TAIL
+        self._transcript.insert("end", *chunks)
+        if len(self._message_lines) > _MAX_MESSAGES + _PRUNE_SLACK:
+            excess = 0
+            while len(self._message_lines) > _MAX_MESSAGES:
+                excess += self._message_lines.popleft()
+            self._transcript.delete("1.0", f"{excess + 1}.0")
+        if follow:
+            self._transcript.see("end")
+
+    # ── Public API (thread-safe) ──────────────────────────────────────────────
 
     def add_message(self, speaker: str, text: str) -> None:
         """Append a message to the transcript.  Safe to call from any thread."""
-        self.after(0, self._append_transcript, speaker, text)
-
-    def _append_transcript(self, speaker: str, text: str) -> None:
-        self._transcript.configure(state="normal")
-        ts = datetime.now().strftime("%H:%M")
-        self._transcript.insert(
-            "end",
-            f"\n[{ts}] {speaker}:\n{text}\n",
-        )
-        self._transcript.configure(state="disabled")
-        self._transcript.see("end")
+        self._post(("msg", speaker, text))
 
     def set_status(self, status: str, colour: str | None = None) -> None:
         """Update the status indicator.  Safe to call from any thread."""
-        self.after(0, self._set_status_main, status, colour)
+        with self._state_lock:
+            self._state = None
+            self._post(("status", status, colour))
+
+    def set_state(self, state: str) -> None:
+        """
+        Show an interaction state ("idle", "listening", "thinking" or
+        "speaking").  Only posts to the Tk thread when the state changes.
+        Safe to call from any thread.
+        """
+        label, colour = _STATES[state]
+        with self._state_lock:
+            if state == self._state:
+                return
+            self._state = state
+            self._post(("status", label, colour))
 
     def _set_status_main(self, status: str, colour: str | None) -> None:
         fg = colour or _STATUS_IDLE
@@ -205,26 +363,17 @@ class DonnaWindow(ctk.CTk):
 
     def set_agenda(self, text: str) -> None:
         """Update the agenda bar.  Safe to call from any thread."""
-        self.after(0, self._agenda_label.configure, {"text": f"  {text}"})
+        self._post(("agenda", text))
 
     def set_listening(self, active: bool) -> None:
         """Convenience: toggle listening indicator."""
-        if active:
-            self.set_status("Listening…", _STATUS_ON)
-        else:
-            self.set_status("Idle", _STATUS_IDLE)
+        self.set_state("listening" if active else "idle")
 
     def set_thinking(self, active: bool) -> None:
-        if active:
-            self.set_status("Thinking…", "#FFA500")
-        else:
-            self.set_status("Idle", _STATUS_IDLE)
+        self.set_state("thinking" if active else "idle")
 
     def set_speaking(self, active: bool) -> None:
-        if active:
-            self.set_status("Speaking…", "#2196F3")
-        else:
-            self.set_status("Idle", _STATUS_IDLE)
+        self.set_state("speaking" if active else "idle")
 
     def show(self) -> None:
         self.after(0, self.deiconify)
@@ -20,7 +20,6 @@ import threading
 from typing import Callable
 
 import pyaudio
-import collections
 
 import numpy as np
 
@@ -29,13 +28,25 @@ from donna.config import (
     WAKE_WORD_MODEL_PATH,
     WAKE_WORD_SENSITIVITY,
     AUDIO_SAMPLE_RATE,
+    VAD_MODE,
+    VAD_SAMPLE_RATE,
+    VAD_FRAME_DURATION_MS,
+    VAD_SILENCE_FRAMES,
+    STT_ENERGY_THRESHOLD,
 )
+from donna.stt import get_vad, pcm16_to_float32
 
 logger = logging.getLogger(__name__)
 
 # Porcupine requires exactly 512-sample frames at 16 kHz
 _PORCUPINE_FRAME_LENGTH = 512
 
+# Frame size used for VAD when capturing STT audio from the wake stream
+_VAD_FRAME_SAMPLES = int(VAD_SAMPLE_RATE * VAD_FRAME_DURATION_MS / 1000)
+_VAD_FRAME_BYTES = _VAD_FRAME_SAMPLES * 2  # 16-bit PCM
+# STT_ENERGY_THRESHOLD is an RMS level; frames are compared by sum of squares
+_SPEECH_ENERGY = np.int64(STT_ENERGY_THRESHOLD ** 2 * _VAD_FRAME_SAMPLES)
+
 
 class WakeWordEngine:
     """
@@ -170,15 +181,14 @@ class WakeWordEngine:
 
     def _run(self) -> None:
         logger.debug("WakeWordEngine thread started.")
+        frame_length = self._porcupine.frame_length
+        # Porcupine copies the frame into a C array via *pcm, which is fastest
+        # from a tuple of ints; an ndarray would box a NumPy scalar per sample.
+        unpack = struct.Struct(f"{frame_length}h").unpack
         try:
             while not self._stop_event.is_set():
-                pcm = self._stream.read(
-                    self._porcupine.frame_length, exception_on_overflow=False
-                )
-                pcm_unpacked = struct.unpack_from(
-                    f"{self._porcupine.frame_length}h", pcm
-                )
-                result = self._porcupine.process(pcm_unpacked)
+                pcm = self._stream.read(frame_length, exception_on_overflow=False)
+                result = self._porcupine.process(unpack(pcm))
                 if result >= 0:
                     logger.info("Wake word detected (keyword index %d).", result)
                     try:
@@ -195,44 +205,36 @@ class WakeWordEngine:
         timeout_seconds: float = 15.0,
         stop_flag: threading.Event | None = None,
         silence_frames_override: int | None = None,
-    ) -> bytes | None:
+    ) -> np.ndarray | None:
         """Capture microphone audio from the existing wake-word stream for STT.
 
         Reads raw PCM frames directly from the wake-word `PyAudio` stream and
-        performs VAD to collect voiced frames, returning WAV bytes suitable
-        for transcription. Safe to call from within the wake-word thread.
+        performs VAD to collect voiced frames, returning float32 samples
+        suitable for transcription. Safe to call from within the wake-word thread.
         """
-        try:
-            import webrtcvad
-            import io
-            import wave
-            from donna.config import (
-                VAD_MODE,
-                VAD_SAMPLE_RATE,
-                VAD_FRAME_DURATION_MS,
-                VAD_SILENCE_FRAMES,
-                STT_ENERGY_THRESHOLD,
-                AUDIO_CHANNELS,
-            )
-        except Exception:
-            logger.exception("Failed to import VAD dependencies for capture_audio_for_stt.")
-            return None
-
         if self._stream is None:
             logger.warning("WakeWordEngine stream not available for capture.")
             return None
 
-        vad = webrtcvad.Vad(VAD_MODE)
-        frame_samples = int(VAD_SAMPLE_RATE * VAD_FRAME_DURATION_MS / 1000)
+        vad = get_vad(VAD_MODE)
+        frame_samples = _VAD_FRAME_SAMPLES
+        frame_bytes = _VAD_FRAME_BYTES
 
+        # Pre-speech padding: fixed ring of frames written in place at pad_pos
         padding_frames = 10
-        ring_buffer: collections.deque[bytes] = collections.deque(maxlen=padding_frames)
+        pad_buf = bytearray(padding_frames * frame_bytes)
+        pad_pos = 0
+        pad_full = False
         triggered = False
-        voiced_frames: list[bytes] = []
         silence_count = 0
         total_frames = 0
         max_frames = int(timeout_seconds * 1000 / VAD_FRAME_DURATION_MS)
+        # Voiced audio is copied into one preallocated buffer; write_off is its end
+        audio_buf = bytearray(max_frames * frame_bytes)
+        write_off = 0
         silence_target = silence_frames_override if silence_frames_override is not None else VAD_SILENCE_FRAMES
+        # Reused widening buffer for the per-frame sum of squares
+        wide = np.empty(frame_samples, dtype=np.int64)
 
         try:
             while total_frames < max_frames:
@@ -242,63 +244,48 @@ class WakeWordEngine:
                 raw = self._stream.read(frame_samples, exception_on_overflow=False)
                 total_frames += 1
 
-                # Interpret raw frames as int16 or float32 and normalize to
-                # int16-equivalent units so the configured energy threshold
-                # (which expects values ~300) makes sense.
-                raw_format = "int16"
-                samples_for_rms = np.array([], dtype=np.float32)
-                vad_bytes = raw
-                try:
-                    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32)
-                    raw_format = "int16"
-                    samples_for_rms = samples
-                    vad_bytes = raw
-                except Exception:
-                    try:
-                        samples = np.frombuffer(raw, dtype=np.float32).astype(np.float32)
-                        raw_format = "float32"
-                        # If normalized floats in -1..1, scale to int16-equivalent
-                        max_abs = float(np.max(np.abs(samples))) if samples.size else 0.0
-                        if max_abs <= 1.1:
-                            samples_for_rms = samples * 32768.0
-                            scaled = True
-                        else:
-                            samples_for_rms = samples
-                            scaled = False
-                        # Convert to int16 bytes for VAD
-                        try:
-                            int16_bytes = (samples_for_rms.astype(np.int16)).tobytes()
-                            vad_bytes = int16_bytes
-                        except Exception:
-                            vad_bytes = raw
-                    except Exception:
-                        samples_for_rms = np.array([], dtype=np.float32)
-                        vad_bytes = raw
-
-                rms = float(np.sqrt(np.mean(samples_for_rms ** 2))) if samples_for_rms.size else 0.0
+                # The stream is opened as paInt16, so the frame is read in
+                # place and its energy kept as an int64 sum of squares.
+                samples = np.frombuffer(raw, dtype=np.int16)
+                frame = wide[:samples.size]
+                np.copyto(frame, samples)
+                energy = frame @ frame
 
                 if total_frames == 1:
                     logger.info(
-                        "Wake-engine STT first-frame RMS=%.3f (fmt=%s)",
-                        rms,
-                        raw_format,
+                        "Wake-engine STT first-frame RMS=%.3f",
+                        float(np.sqrt(energy / max(samples.size, 1))),
                     )
 
-                is_speech = rms > STT_ENERGY_THRESHOLD
-                try:
-                    is_speech = is_speech or vad.is_speech(vad_bytes, VAD_SAMPLE_RATE)
-                except Exception:
-                    pass
+                # webrtcvad is only consulted for frames under the threshold
+                is_speech = energy > _SPEECH_ENERGY
+                if not is_speech:
+                    try:
+                        is_speech = vad.is_speech(raw, VAD_SAMPLE_RATE)
+                    except Exception:
+                        pass
 
                 if not triggered:
-                    ring_buffer.append(vad_bytes)
+                    pad_buf[pad_pos:pad_pos + frame_bytes] = raw
+                    pad_pos += frame_bytes
+                    if pad_pos == len(pad_buf):
+                        pad_pos = 0
+                        pad_full = True
                     if is_speech:
                         triggered = True
-                        voiced_frames.extend(ring_buffer)
-                        ring_buffer.clear()
+                        # Oldest frame first: once wrapped, it sits at pad_pos
+                        with memoryview(pad_buf) as ring:
+                            parts = (
+                                (ring[pad_pos:], ring[:pad_pos])
+                                if pad_full else (ring[:pad_pos],)
+                            )
+                            for part in parts:
+                                audio_buf[write_off:write_off + len(part)] = part
+                                write_off += len(part)
                         silence_count = 0
                 else:
-                    voiced_frames.append(vad_bytes)
+                    audio_buf[write_off:write_off + frame_bytes] = raw
+                    write_off += frame_bytes
                     if is_speech:
                         silence_count = 0
                     else:
@@ -310,20 +297,15 @@ class WakeWordEngine:
                 "Wake-engine VAD result: %d total frames, triggered=%s, %d voiced frames collected (silence_target=%s).",
                 total_frames,
                 triggered,
-                len(voiced_frames),
+                write_off // frame_bytes,
                 silence_target,
             )
 
-            if not voiced_frames:
+            if not write_off:
                 return None
 
-            buf = io.BytesIO()
-            with wave.open(buf, "wb") as wf:
-                wf.setnchannels(AUDIO_CHANNELS)
-                wf.setsampwidth(2)
-                wf.setframerate(VAD_SAMPLE_RATE)
-                wf.writeframes(b"".join(voiced_frames))
-            return buf.getvalue()
+            with memoryview(audio_buf) as view:
+                return pcm16_to_float32(view[:write_off])
         except Exception:
             logger.exception("Error capturing audio from wake-word stream.")
             return None
@@ -331,9 +313,13 @@ class WakeWordEngine:
 
 # ─── Fuzzy wake word fallback ─────────────────────────────────────────────────
 
-_WAKE_WORD_VARIANTS = {
+_WAKE_WORD_VARIANTS = frozenset({
     "hey donna", "donna", "hey don", "yo donna", "hi donna", "ok donna"
-}
+})
+
+# Any transcript starting with a variant counts (handles "Hey Donna, what's…");
+# str.startswith with a tuple does the prefix checks in C, longest first.
+_WAKE_PREFIXES = tuple(sorted(_WAKE_WORD_VARIANTS, key=len, reverse=True))
 
 
 def is_wake_phrase(text: str) -> bool:
@@ -341,11 +327,4 @@ def is_wake_phrase(text: str) -> bool:
     Return True if `text` (post-STT transcript) matches a wake word variant.
     Used as fallback when Porcupine model is unavailable.
     """
-    text_lower = text.lower().strip().rstrip(".,!?")
-    if text_lower in _WAKE_WORD_VARIANTS:
-        return True
-    # Partial prefix match (handles "Hey Donna, what's…")
-    for variant in _WAKE_WORD_VARIANTS:
-        if text_lower.startswith(variant):
-            return True
-    return False
+    return text.lower().lstrip().startswith(_WAKE_PREFIXES)